@@ -0,0 +1,56 @@
+"""Shared helpers for data migrations.
+
+Large backfills run inside one Alembic transaction by default, holding row
+locks for the whole UPDATE and buffering every row in memory. ``batched_update``
+paginates the work by primary key and commits each page inside an
+``autocommit_block`` so locks stay short and memory stays flat. Typical use in
+a revision::
+
+    from alembic import op
+    import sqlalchemy as sa
+
+    from helpers import batched_update
+
+    def upgrade() -> None:
+        tasks = sa.table("tasks", sa.column("id", sa.String), sa.column("tool", sa.String))
+        batched_update(
+            tasks,
+            where=tasks.c.tool == "codex",
+            set_fn=lambda batch_ids: {"tool": "codex_cli"},
+        )
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def batched_update(
+    table: sa.TableClause,
+    where: Any,
+    set_fn: Callable[[Sequence[Any]], dict[str, Any]],
+    pk: str = "id",
+    batch_size: int = 1000,
+) -> None:
+    """Apply ``UPDATE ... WHERE pk IN (batch)`` in committed batches.
+
+    ``set_fn`` receives the primary keys of the current batch and returns the
+    values mapping for that batch's UPDATE. Rows matching ``where`` are
+    consumed until none remain, so the updated rows must stop matching the
+    predicate (or the loop will not terminate).
+    """
+    pk_col = table.c[pk]
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        while True:
+            batch_ids = [
+                row[0]
+                for row in conn.execute(sa.select(pk_col).where(where).limit(batch_size))
+            ]
+            if not batch_ids:
+                break
+            conn.execute(
+                sa.update(table).where(pk_col.in_(batch_ids)).values(**set_fn(batch_ids))
+            )
@@ -0,0 +1,28 @@
+"""Key flow_iterations by (flow_id, iteration_index) and drop the UUID id"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260901_fi_pk"
+down_revision = "20260901_te_part"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_constraint("flow_iterations_pkey", "flow_iterations", type_="primary")
+    op.drop_column("flow_iterations", "id")
+    op.create_primary_key("flow_iterations_pkey", "flow_iterations", ["flow_id", "iteration_index"])
+    # Both single- and two-column flow_id indexes are redundant with the new
+    # primary key.
+    op.drop_index("ix_flow_iter_flow_idx", table_name="flow_iterations")
+    op.drop_index("ix_flow_iterations_flow_id", table_name="flow_iterations")
+
+
+def downgrade() -> None:
+    op.create_index("ix_flow_iterations_flow_id", "flow_iterations", ["flow_id"])
+    op.create_index("ix_flow_iter_flow_idx", "flow_iterations", ["flow_id", "iteration_index"])
+    op.drop_constraint("flow_iterations_pkey", "flow_iterations", type_="primary")
+    op.add_column("flow_iterations", sa.Column("id", sa.String(length=36), nullable=False))
+    op.create_primary_key("flow_iterations_pkey", "flow_iterations", ["id"])
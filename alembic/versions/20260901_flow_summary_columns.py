@@ -0,0 +1,34 @@
+"""Generated flow summary columns for the polling hot path"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260901_flow_sum"
+down_revision = "20260901_fi_pk"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "flows",
+        sa.Column(
+            "last_iteration",
+            sa.Integer(),
+            sa.Computed("(state->>'last_iteration')::int", persisted=True),
+        ),
+    )
+    op.add_column(
+        "flows",
+        sa.Column(
+            "last_score",
+            sa.Integer(),
+            sa.Computed("(state->>'last_score')::int", persisted=True),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("flows", "last_score")
+    op.drop_column("flows", "last_iteration")
@@ -0,0 +1,63 @@
+"""Convert JSON columns to JSONB and index hot keys"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "20260901_jsonb"
+down_revision = "20240411_conductor"
+branch_labels = None
+depends_on = None
+
+_JSON_COLUMNS = (
+    ("tasks", "spec_json"),
+    ("tasks", "result_json"),
+    ("task_events", "payload"),
+    ("flows", "config"),
+    ("flows", "state"),
+    ("flows", "result"),
+    ("flow_iterations", "critic_task_payload"),
+)
+
+
+def upgrade() -> None:
+    for table, column in _JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB,
+            postgresql_using=f"{column}::jsonb",
+        )
+    op.create_index(
+        "ix_flows_state_gin",
+        "flows",
+        ["state"],
+        postgresql_using="gin",
+        postgresql_ops={"state": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "ix_flows_config_gin",
+        "flows",
+        ["config"],
+        postgresql_using="gin",
+        postgresql_ops={"config": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "ix_flows_last_score",
+        "flows",
+        [sa.text("((state->>'last_score')::int)")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_flows_last_score", table_name="flows")
+    op.drop_index("ix_flows_config_gin", table_name="flows")
+    op.drop_index("ix_flows_state_gin", table_name="flows")
+    for table, column in reversed(_JSON_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,82 @@
+"""Partition task_events by month and index created_at with BRIN"""
+from __future__ import annotations
+
+from datetime import date
+
+from alembic import op
+
+revision = "20260901_te_part"
+down_revision = "20260901_indexes"
+branch_labels = None
+depends_on = None
+
+
+def _month_bounds(anchor: date) -> tuple[date, date]:
+    start = anchor.replace(day=1)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return start, end
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE task_events RENAME TO task_events_old")
+    op.execute(
+        """
+        CREATE TABLE task_events (
+            id BIGINT GENERATED ALWAYS AS IDENTITY,
+            task_id VARCHAR(36) NOT NULL REFERENCES tasks (id),
+            type taskeventtype NOT NULL,
+            payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    # A DEFAULT partition catches rows outside any attached month; operators
+    # attach new monthly partitions ahead of time following this template:
+    #   CREATE TABLE task_events_YYYY_MM PARTITION OF task_events
+    #       FOR VALUES FROM ('YYYY-MM-01') TO ('YYYY-MM+1-01');
+    op.execute("CREATE TABLE task_events_default PARTITION OF task_events DEFAULT")
+    start, end = _month_bounds(date.today())
+    op.execute(
+        f"CREATE TABLE task_events_{start.year}_{start.month:02d} PARTITION OF task_events "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+    op.execute(
+        """
+        INSERT INTO task_events (task_id, type, payload, created_at)
+        SELECT task_id, type, payload, created_at FROM task_events_old
+        """
+    )
+    op.execute("DROP TABLE task_events_old")
+    op.execute(
+        "CREATE INDEX ix_task_events_task_created ON task_events (task_id, created_at DESC)"
+    )
+    op.execute(
+        "CREATE INDEX ix_task_events_created_brin ON task_events USING brin (created_at)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE task_events RENAME TO task_events_part")
+    op.execute(
+        """
+        CREATE TABLE task_events (
+            id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+            task_id VARCHAR(36) NOT NULL REFERENCES tasks (id),
+            type taskeventtype NOT NULL,
+            payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO task_events (task_id, type, payload, created_at)
+        SELECT task_id, type, payload, created_at FROM task_events_part
+        """
+    )
+    op.execute("DROP TABLE task_events_part")
+    op.execute("CREATE INDEX ix_task_events_task_id ON task_events (task_id)")
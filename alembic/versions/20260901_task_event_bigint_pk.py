@@ -0,0 +1,27 @@
+"""Replace task_events UUID primary key with a bigint identity"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260901_te_bigint"
+down_revision = "20260901_jsonb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_constraint("task_events_pkey", "task_events", type_="primary")
+    op.drop_column("task_events", "id")
+    op.add_column(
+        "task_events",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), nullable=False),
+    )
+    op.create_primary_key("task_events_pkey", "task_events", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("task_events_pkey", "task_events", type_="primary")
+    op.drop_column("task_events", "id")
+    op.add_column("task_events", sa.Column("id", sa.String(length=36), nullable=False))
+    op.create_primary_key("task_events_pkey", "task_events", ["id"])
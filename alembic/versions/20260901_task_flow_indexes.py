@@ -0,0 +1,41 @@
+"""Composite and partial indexes matching the task/iteration query patterns"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20260901_indexes"
+down_revision = "20260901_te_bigint"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; autocommit each index.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_worker_status_created",
+            "tasks",
+            ["worker_id", "status", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_tasks_active",
+            "tasks",
+            ["status"],
+            postgresql_where=sa.text("status IN ('queued', 'running')"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_flow_iter_flow_idx",
+            "flow_iterations",
+            ["flow_id", "iteration_index"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_flow_iter_flow_idx", table_name="flow_iterations", postgresql_concurrently=True)
+        op.drop_index("ix_tasks_active", table_name="tasks", postgresql_concurrently=True)
+        op.drop_index("ix_tasks_worker_status_created", table_name="tasks", postgresql_concurrently=True)
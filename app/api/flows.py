@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import get_session
 from app.enums import FlowStatus, FlowType
 from app.flows import design_refinement
 from app.models import Flow
-from app.schemas import FlowCreate, FlowRead
+from app.schemas import FlowCreate, FlowRead, FlowSummary
 from app.services.worker_manager import worker_manager
 
 router = APIRouter(prefix="/flows", tags=["flows"])
@@ -41,6 +42,24 @@ async def start_design_flow(
     return FlowRead.model_validate(flow)
 
 
+@router.get("/{flow_id}/summary", response_model=FlowSummary)
+async def get_flow_summary(
+    flow_id: str, response: Response, session: AsyncSession = Depends(get_session)
+) -> FlowSummary:
+    # Thin polling endpoint: only the generated scalar columns, so frequent
+    # UI polls don't ship the multi-kB state/result JSON of the full FlowRead.
+    result = await session.execute(
+        select(Flow.id, Flow.status, Flow.last_iteration, Flow.last_score).where(
+            Flow.id == flow_id
+        )
+    )
+    row = result.first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Flow not found")
+    response.headers["Cache-Control"] = "max-age=1"
+    return FlowSummary.model_validate(row)
+
+
 @router.get("/{flow_id}", response_model=FlowRead)
 async def get_flow(flow_id: str, session: AsyncSession = Depends(get_session)) -> FlowRead:
     flow = await session.get(Flow, flow_id)
@@ -6,7 +6,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import get_session
 from app.schemas import TaskCreate, TaskRead
 from app.services.task_runner import create_task, get_task
-from app.services.worker_manager import worker_manager
 
 router = APIRouter(tags=["tasks"])
 
@@ -17,10 +16,12 @@ async def create_worker_task(
     payload: TaskCreate,
     session: AsyncSession = Depends(get_session),
 ) -> TaskRead:
-    worker = await worker_manager.get_worker(session, worker_id)
-    if not worker:
-        raise HTTPException(status_code=404, detail="Worker not found")
-    task = await create_task(session, worker_id, payload)
+    # create_task loads the worker itself (it needs the workspace path), so a
+    # separate existence check here would just repeat the same SELECT.
+    try:
+        task = await create_task(session, worker_id, payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
     return TaskRead.model_validate(task)
 
 
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-from typing import List
-
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import get_session
-from app.schemas import TaskRead, WorkerCreate, WorkerRead
+from app.schemas import TaskPage, TaskRead, WorkerCreate, WorkerPage, WorkerRead
 from app.services.task_runner import list_worker_tasks
 from app.services.worker_manager import worker_manager
+from app.utils.pagination import encode_cursor
 
 router = APIRouter(prefix="/workers", tags=["workers"])
 
+# Built once at import: per-request TypeAdapter construction re-resolves the
+# core schema, which dominates validation cost on list endpoints.
+_WORKER_LIST_ADAPTER = TypeAdapter(list[WorkerRead])
+_TASK_LIST_ADAPTER = TypeAdapter(list[TaskRead])
+
 
 @router.post("", response_model=WorkerRead)
 async def create_worker(payload: WorkerCreate, session: AsyncSession = Depends(get_session)) -> WorkerRead:
@@ -19,10 +24,21 @@ async def create_worker(payload: WorkerCreate, session: AsyncSession = Depends(g
     return WorkerRead.model_validate(worker)
 
 
-@router.get("", response_model=List[WorkerRead])
-async def list_workers(session: AsyncSession = Depends(get_session)) -> list[WorkerRead]:
-    workers = await worker_manager.list_workers(session)
-    return [WorkerRead.model_validate(worker) for worker in workers]
+@router.get("", response_model=WorkerPage)
+async def list_workers(
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_session),
+) -> WorkerPage:
+    workers = await worker_manager.list_workers(session, limit=limit, cursor=cursor)
+    next_cursor = None
+    if len(workers) == limit:
+        last = workers[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return WorkerPage(
+        items=_WORKER_LIST_ADAPTER.validate_python(workers, from_attributes=True),
+        next_cursor=next_cursor,
+    )
 
 
 @router.get("/{worker_id}", response_model=WorkerRead)
@@ -33,10 +49,22 @@ async def get_worker(worker_id: str, session: AsyncSession = Depends(get_session
     return WorkerRead.model_validate(worker)
 
 
-@router.get("/{worker_id}/tasks", response_model=List[TaskRead])
-async def get_worker_tasks(worker_id: str, session: AsyncSession = Depends(get_session)) -> list[TaskRead]:
+@router.get("/{worker_id}/tasks", response_model=TaskPage)
+async def get_worker_tasks(
+    worker_id: str,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_session),
+) -> TaskPage:
     worker = await worker_manager.get_worker(session, worker_id)
     if not worker:
         raise HTTPException(status_code=404, detail="Worker not found")
-    tasks = await list_worker_tasks(session, worker_id)
-    return [TaskRead.model_validate(task) for task in tasks]
+    tasks = await list_worker_tasks(session, worker_id, limit=limit, cursor=cursor)
+    next_cursor = None
+    if len(tasks) == limit:
+        last = tasks[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return TaskPage(
+        items=_TASK_LIST_ADAPTER.validate_python(tasks, from_attributes=True),
+        next_cursor=next_cursor,
+    )
@@ -0,0 +1,32 @@
+"""Production entrypoint running uvicorn with uvloop and httptools.
+
+The dev Procfile keeps ``uvicorn app.main:app --reload``; this module is for
+deployments: ``python -m app.asgi``. uvloop's event loop and httptools'
+HTTP parser are both C implementations that cut per-request overhead on this
+I/O-bound service.
+
+Workers default to 1 because the runtime registry and flow coordinator are
+in-process singletons; scale workers only once flows run through the queue
+worker (CONDUCTOR_FLOW_BROKER_URL) so multiple uvicorn workers cannot
+double-run a flow.
+"""
+from __future__ import annotations
+
+import uvicorn
+
+from app.config import settings
+
+
+def main() -> None:
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=settings.uvicorn_workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
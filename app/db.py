@@ -1,14 +1,43 @@
 from __future__ import annotations
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
 Base = declarative_base()
 
 
-engine = create_async_engine(settings.database_url, echo=False, future=True)
+# Explicit pool sizing so concurrent requests reuse warm connections instead of
+# serializing on the SQLAlchemy default of five. Alembic keeps its own NullPool
+# in env.py; migrations want fresh connections.
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+)
+
+_PG_ENUM_TYPES = ("workerstatus", "taskstatus", "taskeventtype", "flowstatus", "flowtype")
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _register_enum_codecs(dbapi_connection, connection_record) -> None:
+    # Decode Postgres enum labels straight to str so asyncpg skips its per-row
+    # enum object construction; Pydantic schemas use use_enum_values to match.
+    async def _register(conn) -> None:
+        for type_name in _PG_ENUM_TYPES:
+            await conn.set_type_codec(
+                type_name, encoder=str, decoder=str, schema="public", format="text"
+            )
+
+    dbapi_connection.run_async(_register)
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 
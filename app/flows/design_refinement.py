@@ -1,31 +1,56 @@
 from __future__ import annotations
 
 import asyncio
+import re
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import selectinload
 
+from app.config import settings
 from app.enums import FlowStatus, TaskStatus
 from app.models import Flow, FlowIteration, Task, Worker
 from app.schemas import TaskCreate
+from app.services import task_runner
 from app.services.task_runner import create_task
 
+_WORD_RE = re.compile(rb"\S+")
+_PERF_RE = re.compile(rb"performance", re.IGNORECASE)
+
 
 class DesignRefinementCoordinator:
+    # Only the iteration number varies between coder specs; the static parts
+    # are frozen here so each iteration allocates one shallow copy.
+    _SPEC_DESCRIPTION = "Refine design document"
+    _SPEC_FILES = ("design.md",)
+    _SPEC_INSTRUCTIONS = (
+        "Update design.md to reflect feedback and improve clarity, performance, and feasibility. "
+        "This is iteration {iteration} of the refinement loop."
+    )
+
     def __init__(self, sessionmaker: async_sessionmaker) -> None:
         self.sessionmaker = sessionmaker
 
     def kickoff(self, flow_id: str) -> None:
+        if settings.flow_broker_url:
+            from app.workers.flow_worker import enqueue_flow
+
+            enqueue_flow(flow_id)
+            return
         asyncio.create_task(self._run(flow_id))
 
     async def _run(self, flow_id: str) -> None:
         async with self.sessionmaker() as session:
-            flow = await session.get(Flow, flow_id)
+            result = await session.execute(
+                select(Flow).options(selectinload(Flow.worker)).where(Flow.id == flow_id)
+            )
+            flow = result.scalar_one_or_none()
             if not flow:
                 return
-            worker = await session.get(Worker, flow.worker_id)
+            worker = flow.worker
             if not worker:
                 flow.status = FlowStatus.failed
                 flow.result = {"reason": "worker_missing"}
@@ -34,7 +59,9 @@ class DesignRefinementCoordinator:
             config = flow.config
         workspace = Path(worker.workspace_path)
         design_path = workspace / "design.md"
-        self._write_initial_design(design_path, config["initial_prompt"])
+        # File I/O runs in worker threads so concurrent flows don't stall the
+        # event loop on disk access.
+        await asyncio.to_thread(self._write_initial_design, design_path, config["initial_prompt"])
         for iteration in range(1, config["max_iterations"] + 1):
             coder_spec = self._build_coder_spec(config, iteration)
             payload = TaskCreate(tool="codex", spec=coder_spec, flow_id=flow_id)
@@ -45,7 +72,7 @@ class DesignRefinementCoordinator:
             if finished_task.status == TaskStatus.failed:
                 await self._mark_failed(flow_id, "coder_task_failed", {"task_id": task_id})
                 return
-            critic_result = self._run_carmack_critic(design_path, iteration)
+            critic_result = await asyncio.to_thread(self._run_carmack_critic, design_path, iteration)
             await self._record_iteration(flow_id, iteration, task_id, critic_result)
             if critic_result["score"] >= config["min_score"]:
                 await self._mark_completed(flow_id, iteration, critic_result)
@@ -53,16 +80,13 @@ class DesignRefinementCoordinator:
         await self._mark_failed(flow_id, "max_iterations_reached", None)
 
     def _write_initial_design(self, path: Path, prompt: str) -> None:
-        path.write_text(f"# Design Draft\n\n{prompt}\n")
+        path.write_bytes(f"# Design Draft\n\n{prompt}\n".encode("utf-8"))
 
     def _build_coder_spec(self, config: dict[str, Any], iteration: int) -> dict[str, Any]:
         return {
-            "description": "Refine design document",
-            "files": ["design.md"],
-            "instructions": (
-                "Update design.md to reflect feedback and improve clarity, performance, and feasibility. "
-                f"This is iteration {iteration} of the refinement loop."
-            ),
+            "description": self._SPEC_DESCRIPTION,
+            "files": list(self._SPEC_FILES),
+            "instructions": self._SPEC_INSTRUCTIONS.format(iteration=iteration),
             "context": {
                 "iteration": iteration,
                 "initial_prompt": config["initial_prompt"],
@@ -70,14 +94,20 @@ class DesignRefinementCoordinator:
         }
 
     def _run_carmack_critic(self, design_path: Path, iteration: int) -> dict[str, Any]:
-        content = design_path.read_text() if design_path.exists() else ""
-        heading_count = content.count("#")
-        length = len(content.split())
+        # Scan the raw bytes: counting headings/words and probing for the
+        # performance keyword this way avoids the str.split() token list and
+        # the full lowercased copy the old implementation allocated.
+        try:
+            content = design_path.read_bytes()
+        except FileNotFoundError:
+            content = b""
+        heading_count = content.count(b"#")
+        length = sum(1 for _ in _WORD_RE.finditer(content))
         score = min(10, 4 + heading_count + (length // 200))
         issues = []
         if heading_count < 3:
             issues.append("Add more structured sections to the design.")
-        if "performance" not in content.lower():
+        if _PERF_RE.search(content) is None:
             issues.append("Explicitly discuss performance considerations.")
         suggestions = "Iterate on the architecture and quantify trade-offs."
         return {
@@ -95,15 +125,20 @@ class DesignRefinementCoordinator:
         task_id: str,
         critic_result: dict[str, Any],
     ) -> None:
+        # One transaction: update the flow state and append the iteration row
+        # without the SELECT-then-reassign round trip.
         async with self.sessionmaker() as session:
-            flow = await session.get(Flow, flow_id)
-            if not flow:
-                return
-            flow.state = {
-                "last_iteration": iteration,
-                "last_score": critic_result["score"],
-                "last_critic": critic_result,
-            }
+            await session.execute(
+                update(Flow)
+                .where(Flow.id == flow_id)
+                .values(
+                    state={
+                        "last_iteration": iteration,
+                        "last_score": critic_result["score"],
+                        "last_critic": critic_result,
+                    }
+                )
+            )
             session.add(
                 FlowIteration(
                     flow_id=flow_id,
@@ -115,24 +150,22 @@ class DesignRefinementCoordinator:
             await session.commit()
 
     async def _mark_completed(self, flow_id: str, iteration: int, critic_result: dict[str, Any]) -> None:
-        async with self.sessionmaker() as session:
-            flow = await session.get(Flow, flow_id)
-            if not flow:
-                return
-            flow.status = FlowStatus.completed
-            flow.result = {
-                "final_iteration": iteration,
-                "critic": critic_result,
-            }
-            await session.commit()
+        await self._update_flow(
+            flow_id,
+            status=FlowStatus.completed,
+            result={"final_iteration": iteration, "critic": critic_result},
+        )
 
     async def _mark_failed(self, flow_id: str, reason: str, details: dict[str, Any] | None) -> None:
+        await self._update_flow(
+            flow_id,
+            status=FlowStatus.failed,
+            result={"reason": reason, "details": details},
+        )
+
+    async def _update_flow(self, flow_id: str, **values: Any) -> None:
         async with self.sessionmaker() as session:
-            flow = await session.get(Flow, flow_id)
-            if not flow:
-                return
-            flow.status = FlowStatus.failed
-            flow.result = {"reason": reason, "details": details}
+            await session.execute(update(Flow).where(Flow.id == flow_id).values(**values))
             await session.commit()
 
 
@@ -141,12 +174,15 @@ def _now() -> datetime:
 
 
 async def wait_for_task_completion(sessionmaker: async_sessionmaker, task_id: str) -> Task:
-    while True:
-        async with sessionmaker() as session:
-            task = await session.get(Task, task_id)
-            if task and task.status in {TaskStatus.completed, TaskStatus.failed}:
-                return task
-        await asyncio.sleep(1)
+    # The runtime sets the task's event when it reaches a terminal state, so we
+    # block on that instead of polling the database once per second. Tasks that
+    # finished before we got here have already had their waiter popped, in which
+    # case the row is terminal and a single fetch suffices.
+    event = task_runner.get_task_waiter(task_id)
+    if event is not None:
+        await event.wait()
+    async with sessionmaker() as session:
+        return await session.get(Task, task_id)
 
 
 design_flow_coordinator: DesignRefinementCoordinator | None = None
@@ -3,7 +3,21 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import Enum as SQLEnum
 
@@ -31,20 +45,24 @@ class Worker(Base):
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
 
-    tasks: Mapped[list["Task"]] = relationship(back_populates="worker")
+    tasks: Mapped[list["Task"]] = relationship(back_populates="worker", lazy="selectin")
 
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_worker_status_created", "worker_id", "status", text("created_at DESC")),
+        Index("ix_tasks_active", "status", postgresql_where=text("status IN ('queued', 'running')")),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     worker_id: Mapped[str] = mapped_column(ForeignKey("workers.id"), nullable=False, index=True)
     tool: Mapped[str] = mapped_column(String(32), nullable=False)
-    spec_json: Mapped[dict] = mapped_column(JSON, nullable=False)
+    spec_json: Mapped[dict] = mapped_column(JSONB, nullable=False)
     status: Mapped[TaskStatus] = mapped_column(
         SQLEnum(TaskStatus), default=TaskStatus.queued, nullable=False
     )
-    result_json: Mapped[dict | None] = mapped_column(JSON)
+    result_json: Mapped[dict | None] = mapped_column(JSONB)
     error_message: Mapped[str | None] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
@@ -54,18 +72,30 @@ class Task(Base):
     flow_id: Mapped[str | None] = mapped_column(ForeignKey("flows.id"), nullable=True)
 
     worker: Mapped[Worker] = relationship(back_populates="tasks")
-    events: Mapped[list["TaskEvent"]] = relationship(back_populates="task", cascade="all, delete-orphan")
+    events: Mapped[list["TaskEvent"]] = relationship(
+        back_populates="task", cascade="all, delete-orphan", lazy="selectin"
+    )
 
 
 class TaskEvent(Base):
     __tablename__ = "task_events"
+    __table_args__ = (
+        Index("ix_task_events_task_created", "task_id", text("created_at DESC")),
+        Index("ix_task_events_created_brin", "created_at", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
-    task_id: Mapped[str] = mapped_column(ForeignKey("tasks.id"), nullable=False, index=True)
+    # Surrogate bigint key: events are append-only and never addressed by id
+    # from outside the database, so an 8-byte identity beats a 36-byte UUID in
+    # B-tree size and insert locality.
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)
+    task_id: Mapped[str] = mapped_column(ForeignKey("tasks.id"), nullable=False)
     type: Mapped[TaskEventType] = mapped_column(SQLEnum(TaskEventType), nullable=False)
-    payload: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    # Part of the primary key because partitioned tables must include the
+    # partition key in every unique constraint.
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
+        DateTime(timezone=True), primary_key=True, nullable=False, server_default=func.now()
     )
 
     task: Mapped[Task] = relationship(back_populates="events")
@@ -80,29 +110,38 @@ class Flow(Base):
         SQLEnum(FlowStatus), default=FlowStatus.running, nullable=False
     )
     worker_id: Mapped[str] = mapped_column(ForeignKey("workers.id"), nullable=False)
-    config: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
-    state: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
-    result: Mapped[dict | None] = mapped_column(JSON)
+    config: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    state: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    result: Mapped[dict | None] = mapped_column(JSONB)
+    # Generated from state so pollers can read progress without shipping the
+    # full JSON payloads (see GET /flows/{id}/summary).
+    last_iteration: Mapped[int | None] = mapped_column(
+        Integer, Computed("(state->>'last_iteration')::int", persisted=True)
+    )
+    last_score: Mapped[int | None] = mapped_column(
+        Integer, Computed("(state->>'last_score')::int", persisted=True)
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), onupdate=func.now())
 
-    worker: Mapped[Worker] = relationship()
+    worker: Mapped[Worker] = relationship(lazy="selectin")
     tasks: Mapped[list[Task]] = relationship()
     iterations: Mapped[list["FlowIteration"]] = relationship(
-        back_populates="flow", cascade="all, delete-orphan"
+        back_populates="flow", cascade="all, delete-orphan", lazy="selectin"
     )
 
 
 class FlowIteration(Base):
     __tablename__ = "flow_iterations"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
-    flow_id: Mapped[str] = mapped_column(ForeignKey("flows.id"), nullable=False, index=True)
-    iteration_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Iterations are only ever addressed by (flow, index); the composite key
+    # doubles as the lookup index and makes retried inserts idempotent.
+    flow_id: Mapped[str] = mapped_column(ForeignKey("flows.id"), primary_key=True)
+    iteration_index: Mapped[int] = mapped_column(Integer, primary_key=True)
     coder_task_id: Mapped[str | None] = mapped_column(String(36))
-    critic_task_payload: Mapped[dict | None] = mapped_column(JSON)
+    critic_task_payload: Mapped[dict | None] = mapped_column(JSONB)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
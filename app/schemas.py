@@ -13,7 +13,7 @@ class WorkerCreate(BaseModel):
 
 
 class WorkerRead(BaseModel):
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "use_enum_values": True}
 
     id: str
     label: str | None
@@ -25,6 +25,11 @@ class WorkerRead(BaseModel):
     last_seen_at: datetime
 
 
+class WorkerPage(BaseModel):
+    items: list[WorkerRead]
+    next_cursor: str | None = None
+
+
 class TaskCreate(BaseModel):
     tool: str
     spec: dict[str, Any] = Field(default_factory=dict)
@@ -32,7 +37,7 @@ class TaskCreate(BaseModel):
 
 
 class TaskRead(BaseModel):
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "use_enum_values": True}
 
     id: str
     worker_id: str
@@ -46,6 +51,11 @@ class TaskRead(BaseModel):
     finished_at: datetime | None
 
 
+class TaskPage(BaseModel):
+    items: list[TaskRead]
+    next_cursor: str | None = None
+
+
 class FlowCreate(BaseModel):
     worker_id: str
     initial_prompt: str
@@ -53,8 +63,17 @@ class FlowCreate(BaseModel):
     min_score: int = 9
 
 
+class FlowSummary(BaseModel):
+    model_config = {"from_attributes": True, "use_enum_values": True}
+
+    id: str
+    status: FlowStatus
+    last_iteration: int | None
+    last_score: int | None
+
+
 class FlowRead(BaseModel):
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "use_enum_values": True}
 
     id: str
     type: FlowType
@@ -1,22 +1,198 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
 import re
+import shlex
 import sqlite3
-import subprocess
+import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Iterable, Iterator
+from typing import Any, NamedTuple
+
+import orjson
 
 from app.config import settings
 from app.services.terminal_emulator import TerminalDimensions, TerminalEmulator
 
-ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
+try:  # optional SIMD regex engine; the stdlib path below stays the fallback
+    import hyperscan
+except ImportError:  # pragma: no cover - depends on environment
+    hyperscan = None
+
+try:  # optional SIMD hash; sha256 stays the fallback
+    from blake3 import blake3
+except ImportError:  # pragma: no cover - depends on environment
+    blake3 = None
+
+try:  # optional linear-time regex engine; the stdlib engine stays the fallback
+    import re2
+except ImportError:  # pragma: no cover - depends on environment
+    re2 = None
+
+try:  # optional multi-literal matcher; literals fold into the regex union instead
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on environment
+    ahocorasick = None
+
+
+def _hash_snapshot(data: bytes) -> str:
+    # Pure change detection, no security requirement: blake3 is roughly an
+    # order of magnitude faster per byte, and 16 bytes of digest is ample.
+    if blake3 is not None:
+        return blake3(data).hexdigest(length=16)
+    return sha256(data).hexdigest()
+
+_ANSI_PATTERN = rb"\x1b\[[0-?]*[ -/]*[@-~]"
+ANSI_ESCAPE_RE = re.compile(_ANSI_PATTERN.decode("ascii"))
+
+def _compile_union(patterns: list[str]) -> Any:
+    # Pack patterns come from user-editable files and run against arbitrary
+    # pane text, so prefer RE2: its DFA guarantees linear time (no ReDoS).
+    # Unions using features RE2 lacks (backreferences, lookaround) fall back
+    # to the stdlib backtracking engine.
+    if not patterns:
+        return None
+    source = "|".join(f"(?:{pattern})" for pattern in patterns)
+    if re2 is not None:
+        try:
+            return re2.compile(source, re2.MULTILINE | re2.IGNORECASE)
+        except re2.error:
+            pass
+    return re.compile(source, re.MULTILINE | re.IGNORECASE)
+
+
+# Shared across all classifier instances: one warm TLS connection (HTTP/2 when
+# the h2 extra is installed) instead of a handshake per classification.
+_http_client = None
+
+
+def _get_http_client():
+    global _http_client
+    if _http_client is None:
+        import httpx  # lazy import to avoid dependency for users who skip LLM mode
+
+        limits = httpx.Limits(max_keepalive_connections=4)
+        try:
+            _http_client = httpx.AsyncClient(http2=True, timeout=30.0, limits=limits)
+        except ImportError:  # h2 extra not installed
+            _http_client = httpx.AsyncClient(timeout=30.0, limits=limits)
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+class TmuxControlClient:
+    """Persistent tmux control-mode (``-C``) connection.
+
+    One long-lived subprocess replaces a fork+exec per tmux call: commands go
+    down stdin and replies come back framed in %begin/%end blocks. tmux emits
+    one block per command, so a chained ``a ; b`` line yields two blocks.
+    """
+
+    _SESSION = "_agentbay_ctl"
+    _READ_TIMEOUT = 10.0
+
+    def __init__(self, tmux_bin: str) -> None:
+        self.tmux_bin = tmux_bin
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+
+    async def run(self, args: tuple[str, ...]) -> str | None:
+        """Run a tmux command sequence; returns combined output or None on failure."""
+        command, blocks = self._format(args)
+        async with self._lock:
+            try:
+                proc = await self._connect()
+                proc.stdin.write(command.encode("utf-8") + b"\n")
+                await proc.stdin.drain()
+                return await self._read_blocks(proc, blocks)
+            except Exception as exc:
+                logging.warning("tmux control-mode command failed, resetting: %s", exc)
+                await self.aclose()
+                return None
+
+    async def aclose(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            proc.kill()
+            await proc.wait()
+        except ProcessLookupError:
+            pass
+
+    async def _connect(self) -> asyncio.subprocess.Process:
+        if self._proc is None or self._proc.returncode is not None:
+            self._proc = await asyncio.create_subprocess_exec(
+                self.tmux_bin,
+                "-C",
+                "new-session",
+                "-A",
+                "-s",
+                self._SESSION,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            # tmux frames the connection greeting as an empty block.
+            await self._read_blocks(self._proc, 1)
+        return self._proc
+
+    @staticmethod
+    def _format(args: tuple[str, ...]) -> tuple[str, int]:
+        parts: list[str] = []
+        blocks = 1
+        for arg in args:
+            if arg == ";":
+                blocks += 1
+                parts.append(";")
+            else:
+                parts.append(shlex.quote(arg))
+        return " ".join(parts), blocks
+
+    @classmethod
+    async def _read_blocks(cls, proc: asyncio.subprocess.Process, blocks: int) -> str:
+        out: list[bytes] = []
+        remaining = blocks
+        in_block = False
+        failed = False
+        while remaining:
+            line = await asyncio.wait_for(proc.stdout.readline(), cls._READ_TIMEOUT)
+            if not line:
+                raise RuntimeError("tmux control connection closed")
+            if in_block:
+                if line.startswith(b"%end "):
+                    in_block = False
+                    remaining -= 1
+                elif line.startswith(b"%error"):
+                    in_block = False
+                    remaining -= 1
+                    failed = True
+                else:
+                    out.append(line)
+            elif line.startswith(b"%begin "):
+                in_block = True
+            # Anything else is an async notification (%output, %session-changed,
+            # ...) and irrelevant to the command in flight.
+        if failed:
+            raise RuntimeError("tmux control command reported %error")
+        return b"".join(out).decode("utf-8", "replace")
+
+
+_ansi_db = None
+if hyperscan is not None:
+    _ansi_db = hyperscan.Database()
+    _ansi_db.compile(expressions=[_ANSI_PATTERN], ids=[0], flags=[hyperscan.HS_FLAG_SOM_LEFTMOST])
 
 
 @dataclass
@@ -27,19 +203,14 @@ class WorkerMetadata:
     cli_type: str
 
 
-@dataclass
-class PaneSnapshot:
-    raw_text: str
-    rendered_text: str
-
-
-@dataclass
-class PaneInfo:
+class PaneInfo(NamedTuple):
+    # NamedTuple rather than a dataclass: these are built for every pane on
+    # every poll and only ever read, and tuple field access is C-implemented.
     pane_id: str
     session_name: str
     window_index: str
     pane_index: str
-    cwd: Path
+    cwd: str
     title: str
     width: int
     height: int
@@ -54,6 +225,9 @@ class PaneState:
     last_raw_hash: str | None = None
     last_rendered_hash: str | None = None
     last_classified_hash: str | None = None
+    last_raw_len: int = 0
+    last_raw_tail: bytes = b""
+    last_status_bytes: bytes = b""
     stable_count: int = 0
     last_change_ts: float = field(default_factory=lambda: time.time())
     state: str = "UNKNOWN"
@@ -69,6 +243,14 @@ class ClassificationResult:
     actions_needed: str | None = None
 
 
+@dataclass
+class PendingClassification:
+    pane: PaneInfo
+    worker: WorkerMetadata
+    rendered_text: str
+    rendered_hash: str
+
+
 class ClassifierPack:
     """Loads regex cues + few-shot metadata for a CLI."""
 
@@ -83,11 +265,32 @@ class ClassifierPack:
     ) -> None:
         self.name = name
         self.stability_polls = stability_polls
-        flags = re.MULTILINE | re.IGNORECASE
-        self.idle_regexes = [re.compile(pattern, flags) for pattern in idle_patterns]
-        self.busy_regexes = [re.compile(pattern, flags) for pattern in busy_patterns]
-        self.confirm_regexes = [re.compile(pattern, flags) for pattern in confirm_patterns]
-        self.error_regexes = [re.compile(pattern, flags) for pattern in error_patterns]
+        # Most pack cues are literal prompts, not real regexes. Those route to
+        # one Aho-Corasick automaton per category (all N literals in a single
+        # scan); genuine regexes are fused into one alternation so a category
+        # costs a single C-level search either way.
+        self.idle_ac, self.idle_union = self._build_matchers(idle_patterns)
+        self.busy_ac, self.busy_union = self._build_matchers(busy_patterns)
+        self.confirm_ac, self.confirm_union = self._build_matchers(confirm_patterns)
+        self.error_ac, self.error_union = self._build_matchers(error_patterns)
+        self.has_literal_cues = any(
+            automaton is not None
+            for automaton in (self.idle_ac, self.busy_ac, self.confirm_ac, self.error_ac)
+        )
+
+    @staticmethod
+    def _build_matchers(patterns: list[str]) -> tuple[Any, Any]:
+        literals = [p for p in patterns if re.escape(p) == p]
+        if ahocorasick is None or not literals:
+            # Patterns with no metacharacters are valid regexes for
+            # themselves, so the union alone still covers everything.
+            return None, _compile_union(patterns)
+        automaton = ahocorasick.Automaton()
+        for literal in literals:
+            automaton.add_word(literal.lower(), literal)
+        automaton.make_automaton()
+        regexes = [p for p in patterns if re.escape(p) != p]
+        return automaton, _compile_union(regexes)
 
     @classmethod
     def load(cls, cli_type: str) -> "ClassifierPack":
@@ -98,8 +301,8 @@ class ClassifierPack:
             logging.warning("No classifier pack found for %s, falling back to defaults", cli_type)
             return cls(cli_type, settings.watcher_default_stability, [], [], [], [])
         try:
-            raw = json.loads(pack_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
+            raw = orjson.loads(pack_path.read_bytes())
+        except orjson.JSONDecodeError as exc:
             logging.error("Failed to parse classifier pack %s: %s", pack_path, exc)
             return cls(cli_type, settings.watcher_default_stability, [], [], [], [])
         return cls(
@@ -119,25 +322,26 @@ class RegexClassifier:
         self.pack = pack
 
     def classify(self, snapshot: str) -> ClassificationResult:
-        if self._match_any(self.pack.error_regexes, snapshot):
+        snapshot_lower = snapshot.lower() if self.pack.has_literal_cues else ""
+        if self._matches(self.pack.error_ac, self.pack.error_union, snapshot, snapshot_lower):
             return ClassificationResult(
                 state="ERROR",
                 summary="Detected error output",
                 actions_needed="Inspect the PTY logs to unblock the worker.",
             )
-        if self._match_any(self.pack.confirm_regexes, snapshot):
+        if self._matches(self.pack.confirm_ac, self.pack.confirm_union, snapshot, snapshot_lower):
             return ClassificationResult(
                 state="NEEDS_CONFIRMATION",
                 summary="Tool is waiting for explicit confirmation",
                 actions_needed="Answer the confirmation prompt in the PTY.",
             )
-        if self._match_any(self.pack.busy_regexes, snapshot):
+        if self._matches(self.pack.busy_ac, self.pack.busy_union, snapshot, snapshot_lower):
             return ClassificationResult(
                 state="BUSY",
                 summary="Workload still running",
                 actions_needed=None,
             )
-        if self._match_any(self.pack.idle_regexes, snapshot):
+        if self._matches(self.pack.idle_ac, self.pack.idle_union, snapshot, snapshot_lower):
             return ClassificationResult(
                 state="READY",
                 summary="Idle prompt detected",
@@ -151,71 +355,95 @@ class RegexClassifier:
         )
 
     @staticmethod
-    def _match_any(patterns: Iterable[re.Pattern[str]], text: str) -> bool:
-        return any(pattern.search(text) for pattern in patterns)
+    def _matches(automaton: Any, union: Any, snapshot: str, snapshot_lower: str) -> bool:
+        if automaton is not None and next(automaton.iter(snapshot_lower), None) is not None:
+            return True
+        return union is not None and union.search(snapshot) is not None
 
 
 class OpenRouterClassifier:
     """Optional LLM-powered classifier."""
 
+    _SYSTEM_PROMPT = (
+        "You read tmux pane text for a CLI worker. Infer the PTY state using four axes plus metadata.\n"
+        "Return strict JSON matching:\n"
+        "{\n"
+        '  "session_lifecycle": "<DISCONNECTED|LOGIN_OR_SETUP|ACTIVE_SESSION|TEARDOWN>",\n'
+        '  "terminal_mode": "<CANONICAL|RAW|UNKNOWN>",\n'
+        '  "foreground_role": "<SHELL|CHILD_COMMAND|MULTIPLEXER|UNKNOWN>",\n'
+        '  "io_disposition": "<IDLE_AT_PROMPT|STREAMING_OUTPUT|SILENT_PROCESSING|BLOCKED_ON_INPUT|INTERRUPTIBLE_BUSY|UNKNOWN>",\n'
+        '  "error_recent": true,\n'
+        '  "summary": "<short string>",\n'
+        '  "actions_needed": "<string or null>"\n'
+        "}\n"
+        "Axis definitions:\n"
+        "1. session_lifecycle: DISCONNECTED (pane closed), LOGIN_OR_SETUP (ssh/login banners before shell), ACTIVE_SESSION (shell or process running), TEARDOWN (logout/shutdown).\n"
+        "2. terminal_mode: CANONICAL (line-buffered shell), RAW (application controls keys / alternate screen), UNKNOWN.\n"
+        "3. foreground_role: SHELL (bash/zsh prompt owns tty), CHILD_COMMAND (non-shell program), MULTIPLEXER (tmux/screen hosting another shell), UNKNOWN.\n"
+        "4. io_disposition: IDLE_AT_PROMPT (prompt visible, safe to send command), STREAMING_OUTPUT (logs/progress flowing), SILENT_PROCESSING (command running quietly), BLOCKED_ON_INPUT (explicit prompt waiting for y/N/password/etc.), INTERRUPTIBLE_BUSY (async REPLs like Codex that keep processing yet accept new instructions), UNKNOWN.\n"
+        "error_recent indicates whether the last command clearly failed (traceback, non-zero exit). Provide a concise summary and optional actions_needed instruction."
+    )
+    _BATCH_SUFFIX = (
+        "\nYou will receive several pane snapshots delimited by '=== pane <pane_id> ===' headers. "
+        "Classify each pane independently and return one strict JSON object mapping each pane_id "
+        "to its classification object. Do not include panes you were not given."
+    )
+
     def __init__(self, pack: ClassifierPack) -> None:
         self.pack = pack
         self.api_key = settings.openrouter_api_key
         self.model = settings.openrouter_model
-        self._session = None
-
-    def classify(self, snapshot: str, metadata: dict[str, Any]) -> ClassificationResult:
-        import requests  # lazy import to avoid dependency for users who skip LLM mode
 
+    async def classify(self, snapshot: str, metadata: dict[str, Any]) -> ClassificationResult:
+        data = await self._request(
+            self._SYSTEM_PROMPT,
+            f"CLI type: {metadata.get('cli_type')}\nSnapshot:\n{snapshot}",
+        )
+        parsed = orjson.loads(data["choices"][0]["message"]["content"])
+        return self._to_result(parsed)
+
+    async def classify_batch(
+        self, items: list[tuple[str, str, dict[str, Any]]]
+    ) -> dict[str, ClassificationResult]:
+        # One HTTPS round-trip for every pane that crossed the stability
+        # threshold this poll; latency is dominated by the request, not the
+        # extra prompt tokens.
+        blocks = "".join(
+            f"=== pane {pane_id} ===\nCLI type: {metadata.get('cli_type')}\n{snapshot}\n"
+            for pane_id, snapshot, metadata in items
+        )
+        data = await self._request(self._SYSTEM_PROMPT + self._BATCH_SUFFIX, blocks)
+        parsed = orjson.loads(data["choices"][0]["message"]["content"])
+        results: dict[str, ClassificationResult] = {}
+        for pane_id, _, _ in items:
+            entry = parsed.get(pane_id)
+            if isinstance(entry, dict):
+                results[pane_id] = self._to_result(entry)
+        return results
+
+    async def _request(self, system_prompt: str, user_content: str) -> dict[str, Any]:
         if not self.api_key:
             raise RuntimeError("No OpenRouter API key configured")
-        if self._session is None:
-            self._session = requests.Session()
-        prompt = (
-            "You read tmux pane text for a CLI worker. Infer the PTY state using four axes plus metadata.\n"
-            "Return strict JSON matching:\n"
-            "{\n"
-            '  "session_lifecycle": "<DISCONNECTED|LOGIN_OR_SETUP|ACTIVE_SESSION|TEARDOWN>",\n'
-            '  "terminal_mode": "<CANONICAL|RAW|UNKNOWN>",\n'
-            '  "foreground_role": "<SHELL|CHILD_COMMAND|MULTIPLEXER|UNKNOWN>",\n'
-            '  "io_disposition": "<IDLE_AT_PROMPT|STREAMING_OUTPUT|SILENT_PROCESSING|BLOCKED_ON_INPUT|INTERRUPTIBLE_BUSY|UNKNOWN>",\n'
-            '  "error_recent": true,\n'
-            '  "summary": "<short string>",\n'
-            '  "actions_needed": "<string or null>"\n'
-            "}\n"
-            "Axis definitions:\n"
-            "1. session_lifecycle: DISCONNECTED (pane closed), LOGIN_OR_SETUP (ssh/login banners before shell), ACTIVE_SESSION (shell or process running), TEARDOWN (logout/shutdown).\n"
-            "2. terminal_mode: CANONICAL (line-buffered shell), RAW (application controls keys / alternate screen), UNKNOWN.\n"
-            "3. foreground_role: SHELL (bash/zsh prompt owns tty), CHILD_COMMAND (non-shell program), MULTIPLEXER (tmux/screen hosting another shell), UNKNOWN.\n"
-            "4. io_disposition: IDLE_AT_PROMPT (prompt visible, safe to send command), STREAMING_OUTPUT (logs/progress flowing), SILENT_PROCESSING (command running quietly), BLOCKED_ON_INPUT (explicit prompt waiting for y/N/password/etc.), INTERRUPTIBLE_BUSY (async REPLs like Codex that keep processing yet accept new instructions), UNKNOWN.\n"
-            "error_recent indicates whether the last command clearly failed (traceback, non-zero exit). Provide a concise summary and optional actions_needed instruction."
-        )
         payload = {
             "model": self.model,
             "messages": [
-                {
-                    "role": "system",
-                    "content": prompt,
-                },
-                {
-                    "role": "user",
-                    "content": f"CLI type: {metadata.get('cli_type')}\nSnapshot:\n{snapshot}",
-                },
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content},
             ],
         }
-        response = self._session.post(
+        response = await _get_http_client().post(
             "https://openrouter.ai/api/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json",
             },
             json=payload,
-            timeout=30,
         )
         response.raise_for_status()
-        data = response.json()
-        message = data["choices"][0]["message"]["content"]
-        parsed = json.loads(message)
+        return response.json()
+
+    @staticmethod
+    def _to_result(parsed: dict[str, Any]) -> ClassificationResult:
         return ClassificationResult(
             state=str(parsed.get("state") or "READY"),
             summary=str(parsed.get("summary") or "").strip(),
@@ -226,20 +454,86 @@ class OpenRouterClassifier:
 class HybridClassifier:
     """Attempts OpenRouter first, falling back to regex heuristics."""
 
+    _CACHE_MAX = 512
+
     def __init__(self, pack: ClassifierPack) -> None:
         self.pack = pack
         self.regex = RegexClassifier(pack)
         self._llm: OpenRouterClassifier | None = None
         if settings.openrouter_api_key:
             self._llm = OpenRouterClassifier(pack)
-
-    def classify(self, snapshot: str, metadata: dict[str, Any]) -> ClassificationResult:
+        # Memoize by snapshot hash: panes showing identical content (or one
+        # pane re-crossing the stability threshold) reuse the prior result
+        # instead of repeating an LLM round-trip.
+        self._cache: OrderedDict[tuple[str, str], ClassificationResult] = OrderedDict()
+
+    async def classify(self, snapshot: str, metadata: dict[str, Any]) -> ClassificationResult:
+        key = self._cache_key(metadata)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        result: ClassificationResult | None = None
         if self._llm:
             try:
-                return self._llm.classify(snapshot, metadata)
+                result = await self._llm.classify(snapshot, metadata)
             except Exception as exc:  # pragma: no cover - network failures
                 logging.warning("LLM classification failed for %s: %s", metadata.get("pane_id"), exc)
-        return self.regex.classify(snapshot)
+        if result is None:
+            result = self.regex.classify(snapshot)
+        self._cache_put(key, result)
+        return result
+
+    async def classify_batch(
+        self, items: list[tuple[str, str, dict[str, Any]]]
+    ) -> dict[str, ClassificationResult]:
+        """Classify several panes, spending at most one LLM request."""
+        results: dict[str, ClassificationResult] = {}
+        misses: list[tuple[str, str, dict[str, Any]]] = []
+        for pane_id, snapshot, metadata in items:
+            cached = self._cache_get(self._cache_key(metadata))
+            if cached is not None:
+                results[pane_id] = cached
+            else:
+                misses.append((pane_id, snapshot, metadata))
+        if misses and self._llm:
+            try:
+                llm_results = await self._llm.classify_batch(misses)
+            except Exception as exc:  # pragma: no cover - network failures
+                logging.warning("Batched LLM classification failed: %s", exc)
+                llm_results = {}
+            for pane_id, _, metadata in misses:
+                result = llm_results.get(pane_id)
+                if result is not None:
+                    results[pane_id] = result
+                    self._cache_put(self._cache_key(metadata), result)
+            misses = [item for item in misses if item[0] not in results]
+        for pane_id, snapshot, metadata in misses:
+            result = self.regex.classify(snapshot)
+            results[pane_id] = result
+            self._cache_put(self._cache_key(metadata), result)
+        return results
+
+    @staticmethod
+    def _cache_key(metadata: dict[str, Any]) -> tuple[str, str] | None:
+        snapshot_hash = metadata.get("snapshot_hash")
+        if not snapshot_hash:
+            return None
+        return (str(metadata.get("cli_type") or ""), snapshot_hash)
+
+    def _cache_get(self, key: tuple[str, str] | None) -> ClassificationResult | None:
+        if key is None:
+            return None
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+        return cached
+
+    def _cache_put(self, key: tuple[str, str] | None, result: ClassificationResult) -> None:
+        if key is None:
+            return
+        self._cache[key] = result
+        if len(self._cache) > self._CACHE_MAX:
+            self._cache.popitem(last=False)
 
 
 class StatusStore:
@@ -248,8 +542,13 @@ class StatusStore:
     def __init__(self, path: Path) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(self.path)
+        # Autocommit connection; transactions are opened explicitly so one
+        # poll's worth of upserts shares a single fsync.
+        self._conn = sqlite3.connect(self.path, isolation_level=None)
         self._conn.execute("PRAGMA journal_mode=WAL")
+        # Safe with WAL: a crash can lose the tail of the log but not corrupt.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
         self._init_schema()
 
     def _init_schema(self) -> None:
@@ -290,67 +589,87 @@ class StatusStore:
             )
             """
         )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_status_history_id_ts ON status_history(id, ts)"
+        )
+        self._conn.commit()
+
+    def begin(self) -> None:
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    def commit(self) -> None:
         self._conn.commit()
 
-    def upsert(
+    _PTYS_SQL = """
+        INSERT INTO ptys (id, worker_id, tmux_session, tmux_window, tmux_pane, cwd, cli_type)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            worker_id=excluded.worker_id,
+            tmux_session=excluded.tmux_session,
+            tmux_window=excluded.tmux_window,
+            tmux_pane=excluded.tmux_pane,
+            cwd=excluded.cwd,
+            cli_type=excluded.cli_type
+    """
+    _STATUS_SQL = """
+        INSERT INTO status (id, state, summary, actions_needed, last_snapshot_hash, last_change_ts, last_polled_ts, stable_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            state=excluded.state,
+            summary=excluded.summary,
+            actions_needed=excluded.actions_needed,
+            last_snapshot_hash=excluded.last_snapshot_hash,
+            last_change_ts=excluded.last_change_ts,
+            last_polled_ts=excluded.last_polled_ts,
+            stable_count=excluded.stable_count
+    """
+    _HISTORY_SQL = "INSERT INTO status_history (id, ts, state, summary) VALUES (?, ?, ?, ?)"
+
+    def upsert_many(
         self,
-        pane: PaneInfo,
-        worker: WorkerMetadata,
-        pane_state: PaneState,
-        snapshot_hash: str,
-        polled_ts: float,
+        entries: list[tuple[PaneInfo, WorkerMetadata, PaneState, str, float]],
     ) -> None:
-        self._conn.execute(
-            """
-            INSERT INTO ptys (id, worker_id, tmux_session, tmux_window, tmux_pane, cwd, cli_type)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                worker_id=excluded.worker_id,
-                tmux_session=excluded.tmux_session,
-                tmux_window=excluded.tmux_window,
-                tmux_pane=excluded.tmux_pane,
-                cwd=excluded.cwd,
-                cli_type=excluded.cli_type
-            """,
-            (
-                pane.pane_id,
-                worker.worker_id,
-                pane.session_name,
-                pane.window_index,
-                pane.pane_index,
-                str(pane.cwd),
-                worker.cli_type,
-            ),
-        )
-        self._conn.execute(
-            """
-            INSERT INTO status (id, state, summary, actions_needed, last_snapshot_hash, last_change_ts, last_polled_ts, stable_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                state=excluded.state,
-                summary=excluded.summary,
-                actions_needed=excluded.actions_needed,
-                last_snapshot_hash=excluded.last_snapshot_hash,
-                last_change_ts=excluded.last_change_ts,
-                last_polled_ts=excluded.last_polled_ts,
-                stable_count=excluded.stable_count
-            """,
-            (
-                pane.pane_id,
-                pane_state.state,
-                pane_state.summary,
-                pane_state.actions_needed,
-                snapshot_hash,
-                pane_state.last_change_ts,
-                polled_ts,
-                pane_state.stable_count,
-            ),
-        )
-        self._conn.execute(
-            "INSERT INTO status_history (id, ts, state, summary) VALUES (?, ?, ?, ?)",
-            (pane.pane_id, polled_ts, pane_state.state, pane_state.summary),
-        )
-        self._conn.commit()
+        # One executemany per table reuses a single prepared statement for the
+        # whole poll instead of three parse/bind cycles per pane.
+        if not entries:
+            return
+        ptys_rows = []
+        status_rows = []
+        history_rows = []
+        for pane, worker, pane_state, snapshot_hash, polled_ts in entries:
+            ptys_rows.append(
+                (
+                    pane.pane_id,
+                    worker.worker_id,
+                    pane.session_name,
+                    pane.window_index,
+                    pane.pane_index,
+                    pane.cwd,
+                    worker.cli_type,
+                )
+            )
+            status_rows.append(
+                (
+                    pane.pane_id,
+                    pane_state.state,
+                    pane_state.summary,
+                    pane_state.actions_needed,
+                    snapshot_hash,
+                    pane_state.last_change_ts,
+                    polled_ts,
+                    pane_state.stable_count,
+                )
+            )
+            history_rows.append((pane.pane_id, polled_ts, pane_state.state, pane_state.summary))
+        self.begin()
+        try:
+            self._conn.executemany(self._PTYS_SQL, ptys_rows)
+            self._conn.executemany(self._STATUS_SQL, status_rows)
+            self._conn.executemany(self._HISTORY_SQL, history_rows)
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self.commit()
 
     def close(self) -> None:
         self._conn.close()
@@ -364,9 +683,17 @@ class PtyWatcher:
         self.tmux_bin = settings.tmux_bin
         self.workspace_root = settings.workspace_root
         self.state: dict[str, PaneState] = {}
+        # Pre-load every pack present on disk so _classifier_for is a plain
+        # dict hit on the poll path; keys are interned to compare by identity.
         self._classifiers: dict[str, HybridClassifier] = {}
+        if settings.classifier_packs_dir.exists():
+            for pack_path in sorted(settings.classifier_packs_dir.glob("*.yml")):
+                cli_type = sys.intern(pack_path.stem)
+                self._classifiers[cli_type] = HybridClassifier(ClassifierPack.load(cli_type))
         self.status_store = StatusStore(settings.status_db_path)
         self._emulators: dict[str, TerminalEmulator] = {}
+        self._worker_cache: dict[str, tuple[int, WorkerMetadata]] = {}
+        self._ctl = TmuxControlClient(self.tmux_bin)
 
     async def run(self) -> None:
         logging.info("Starting PTY watcher loop (interval=%ss)", self.interval)
@@ -377,33 +704,69 @@ class PtyWatcher:
         except asyncio.CancelledError:  # pragma: no cover
             logging.info("PTY watcher cancelled")
         finally:
+            await self._ctl.aclose()
+            await aclose_http_client()
             self.status_store.close()
 
     async def _poll_once(self) -> None:
         workers = self._load_workers()
-        panes = self._list_tmux_panes()
+        panes = await self._list_tmux_panes()
         now = time.time()
+        relevant = [
+            (pane, workers[pane.session_name])
+            for pane in panes
+            if pane.session_name in workers
+        ]
+        captures = await self._capture_panes([pane for pane, _ in relevant])
         seen: set[str] = set()
-        for pane in panes:
-            worker = workers.get(pane.session_name)
-            if not worker:
-                continue
+        pending: list[PendingClassification] = []
+        for pane, worker in relevant:
             seen.add(pane.pane_id)
-            await self._process_pane(pane, worker, now)
+            self._process_pane(pane, worker, captures.get(pane.pane_id, ""), now, pending)
+        await self._resolve_classifications(pending)
+        entries: list[tuple[PaneInfo, WorkerMetadata, PaneState, str, float]] = []
+        for pane, worker in relevant:
+            pane_state = self.state[pane.pane_id]
+            self._write_status(worker, pane, pane_state)
+            entries.append((pane, worker, pane_state, pane_state.last_rendered_hash or "", now))
+        # One transaction (one fsync) for the whole poll's upserts.
+        self.status_store.upsert_many(entries)
         # purge panes that disappeared
         removed = set(self.state.keys()) - seen
         for pane_id in removed:
             logging.info("Pane %s disappeared, removing cache entry", pane_id)
             del self.state[pane_id]
 
-    async def _process_pane(self, pane: PaneInfo, worker: WorkerMetadata, ts: float) -> None:
-        snapshot = self._capture_pane_snapshot(pane)
-        raw_hash = sha256(snapshot.raw_text.encode("utf-8")).hexdigest()
-        rendered_hash = sha256(snapshot.rendered_text.encode("utf-8")).hexdigest()
+    def _process_pane(
+        self,
+        pane: PaneInfo,
+        worker: WorkerMetadata,
+        raw_text: str,
+        ts: float,
+        pending: list[PendingClassification],
+    ) -> None:
+        raw_bytes = raw_text.encode("utf-8")
         pane_state = self.state.setdefault(
             pane.pane_id,
             PaneState(threshold=self._classifier_for(worker.cli_type).pack.stability_polls),
         )
+        # Cheap prefilter: idle panes (the common case) keep an identical
+        # length and tail between polls, so skip the ANSI render and both
+        # hashes and reuse the digests computed last time.
+        rendered_text: str | None = None
+        if (
+            pane_state.last_raw_hash is not None
+            and len(raw_bytes) == pane_state.last_raw_len
+            and raw_bytes[-64:] == pane_state.last_raw_tail
+        ):
+            raw_hash = pane_state.last_raw_hash
+            rendered_hash = pane_state.last_rendered_hash
+        else:
+            pane_state.last_raw_len = len(raw_bytes)
+            pane_state.last_raw_tail = raw_bytes[-64:]
+            raw_hash = _hash_snapshot(raw_bytes)
+            rendered_text = self._render_pane(pane, raw_text)
+            rendered_hash = _hash_snapshot(rendered_text.encode("utf-8"))
         if pane_state.last_raw_hash != raw_hash:
             pane_state.last_raw_hash = raw_hash
             pane_state.last_rendered_hash = rendered_hash
@@ -419,29 +782,56 @@ class PtyWatcher:
                 pane_state.stable_count >= threshold
                 and pane_state.last_classified_hash != rendered_hash
             ):
-                classifier = self._classifier_for(worker.cli_type)
-                result = classifier.classify(
-                    snapshot.rendered_text,
-                    {
-                        "worker_id": worker.worker_id,
-                        "pane_id": pane.pane_id,
-                        "cli_type": worker.cli_type,
-                    },
+                if rendered_text is None:
+                    rendered_text = self._render_pane(pane, raw_text)
+                # Defer the actual classification so all panes that crossed
+                # the threshold this poll share a single LLM request.
+                pending.append(
+                    PendingClassification(pane, worker, rendered_text, rendered_hash or "")
                 )
+
+    async def _resolve_classifications(self, pending: list[PendingClassification]) -> None:
+        if not pending:
+            return
+        by_cli: dict[str, list[PendingClassification]] = {}
+        for item in pending:
+            by_cli.setdefault(item.worker.cli_type, []).append(item)
+        for cli_type, items in by_cli.items():
+            classifier = self._classifier_for(cli_type)
+            results = await classifier.classify_batch(
+                [
+                    (
+                        item.pane.pane_id,
+                        item.rendered_text,
+                        {
+                            "worker_id": item.worker.worker_id,
+                            "pane_id": item.pane.pane_id,
+                            "cli_type": cli_type,
+                            "snapshot_hash": item.rendered_hash,
+                        },
+                    )
+                    for item in items
+                ]
+            )
+            for item in items:
+                result = results.get(item.pane.pane_id)
+                if result is None:
+                    continue
+                pane_state = self.state[item.pane.pane_id]
                 pane_state.state = result.state
                 pane_state.summary = result.summary
                 pane_state.actions_needed = result.actions_needed
-                pane_state.last_classified_hash = rendered_hash
-        self._write_status(worker, pane, pane_state, rendered_hash, ts)
+                pane_state.last_classified_hash = item.rendered_hash
 
     def _write_status(
         self,
         worker: WorkerMetadata,
         pane: PaneInfo,
         pane_state: PaneState,
-        rendered_hash: str,
-        ts: float,
     ) -> None:
+        # last_polled_ts lives in the sqlite store only; keeping it out of the
+        # file payload is what lets the identical-content check below skip the
+        # write on every poll where nothing actually changed.
         status_payload = {
             "worker_id": worker.worker_id,
             "pane_id": pane.pane_id,
@@ -451,32 +841,75 @@ class PtyWatcher:
             "summary": pane_state.summary,
             "actions_needed": pane_state.actions_needed,
             "last_change_ts": pane_state.last_change_ts,
-            "last_polled_ts": ts,
         }
+        payload = orjson.dumps(status_payload)
+        if payload == pane_state.last_status_bytes:
+            return
         status_path = worker.workspace / "status.json"
-        status_path.write_text(json.dumps(status_payload, indent=2), encoding="utf-8")
-        self.status_store.upsert(pane, worker, pane_state, rendered_hash, ts)
+        # Write-then-rename so readers never observe a torn file.
+        tmp_path = status_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, status_path)
+        pane_state.last_status_bytes = payload
 
     def _classifier_for(self, cli_type: str) -> HybridClassifier:
         classifier = self._classifiers.get(cli_type)
         if classifier is None:
+            # Only hit for cli_types with no pack on disk at startup.
             pack = ClassifierPack.load(cli_type or settings.default_cli_type)
             classifier = HybridClassifier(pack)
-            self._classifiers[cli_type] = classifier
+            self._classifiers[sys.intern(cli_type)] = classifier
         return classifier
 
-    def _capture_pane_snapshot(self, pane: PaneInfo) -> PaneSnapshot:
-        try:
-            result = subprocess.run(
-                [self.tmux_bin, "capture-pane", "-peJ", "-t", pane.target],
-                check=True,
-                capture_output=True,
-                text=True,
+    async def _run_tmux(self, *args: str) -> str | None:
+        # Preferred path: the persistent control-mode connection (pipe IO, no
+        # fork). A fresh one-shot subprocess remains as the fallback when the
+        # connection cannot be (re)established.
+        result = await self._ctl.run(args)
+        if result is not None:
+            return result
+        proc = await asyncio.create_subprocess_exec(
+            self.tmux_bin,
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        out, err = await proc.communicate()
+        if proc.returncode != 0:
+            logging.error(
+                "tmux %s failed (%s): %s",
+                args[0] if args else "",
+                proc.returncode,
+                err.decode("utf-8", "replace").strip(),
             )
-            raw_text = result.stdout
-        except subprocess.CalledProcessError as exc:
-            logging.error("tmux capture-pane failed for %s: %s", pane.target, exc)
-            raw_text = ""
+            return None
+        return out.decode("utf-8", "replace")
+
+    async def _capture_panes(self, panes: list[PaneInfo]) -> dict[str, str]:
+        # One fork per poll instead of one per pane: tmux chains commands with
+        # ";", and a display-message sentinel after each capture marks where
+        # that pane's output ends in the combined stdout.
+        if not panes:
+            return {}
+        args: list[str] = []
+        for pane in panes:
+            args += ["capture-pane", "-peJ", "-t", pane.target, ";"]
+            args += ["display-message", "-p", f"<<{pane.pane_id}>>", ";"]
+        del args[-1]
+        stdout = await self._run_tmux(*args)
+        if stdout is None:
+            return {}
+        captures: dict[str, str] = {}
+        rest = stdout
+        for pane in panes:
+            text, sep, rest = rest.partition(f"<<{pane.pane_id}>>\n")
+            if not sep:
+                logging.error("Missing capture sentinel for pane %s", pane.pane_id)
+                break
+            captures[pane.pane_id] = text
+        return captures
+
+    def _render_pane(self, pane: PaneInfo, raw_text: str) -> str:
         emulator = self._emulators.get(pane.pane_id)
         if (
             emulator is None
@@ -486,75 +919,96 @@ class PtyWatcher:
             emulator = TerminalEmulator(TerminalDimensions(pane.width, pane.height))
             self._emulators[pane.pane_id] = emulator
         try:
-            rendered = emulator.render(raw_text)
+            return emulator.render(raw_text)
         except Exception:  # pragma: no cover
-            rendered = strip_ansi(raw_text)
-        return PaneSnapshot(raw_text=raw_text, rendered_text=rendered)
+            return strip_ansi(raw_text)
 
-    def _list_tmux_panes(self) -> list[PaneInfo]:
+    async def _list_tmux_panes(self) -> list[PaneInfo]:
+        # Unit separator between fields: it cannot appear in titles/paths the
+        # way whitespace can, so no per-field strip() is needed.
         format_str = (
-            "#{pane_id}\t#{session_name}\t#{window_index}\t#{pane_index}\t#{pane_current_path}\t"
-            "#{pane_title}\t#{pane_width}\t#{pane_height}"
+            "#{pane_id}\x1f#{session_name}\x1f#{window_index}\x1f#{pane_index}\x1f"
+            "#{pane_current_path}\x1f#{pane_title}\x1f#{pane_width}\x1f#{pane_height}"
         )
-        try:
-            result = subprocess.run(
-                [self.tmux_bin, "list-panes", "-a", "-F", format_str],
-                check=True,
-                text=True,
-                capture_output=True,
-            )
-        except subprocess.CalledProcessError as exc:
-            logging.error("Failed to list tmux panes: %s", exc)
+        stdout = await self._run_tmux("list-panes", "-a", "-F", format_str)
+        if stdout is None:
             return []
         panes: list[PaneInfo] = []
-        for line in result.stdout.splitlines():
-            if not line.strip():
-                continue
-            parts = line.split("\t")
+        for line in stdout.splitlines():
+            parts = line.split("\x1f")
             if len(parts) != 8:
                 continue
             pane_id, session, window_index, pane_index, cwd, title, width, height = parts
             panes.append(
                 PaneInfo(
-                    pane_id=pane_id.strip(),
-                    session_name=session.strip(),
-                    window_index=window_index.strip(),
-                    pane_index=pane_index.strip(),
-                    cwd=Path(cwd.strip() or "."),
-                    title=title.strip(),
-                    width=int(width.strip() or 80),
-                    height=int(height.strip() or 24),
+                    pane_id,
+                    session,
+                    window_index,
+                    pane_index,
+                    cwd or ".",
+                    title,
+                    int(width or 80),
+                    int(height or 24),
                 )
             )
         return panes
 
     def _load_workers(self) -> dict[str, WorkerMetadata]:
         workers: dict[str, WorkerMetadata] = {}
-        if not self.workspace_root.exists():
+        try:
+            entries = list(os.scandir(self.workspace_root))
+        except FileNotFoundError:
             return workers
-        for worker_dir in self.workspace_root.iterdir():
-            if not worker_dir.is_dir():
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            meta_path = Path(entry.path) / "worker.json"
+            # worker.json is written once at worker creation; an unchanged
+            # mtime means the parsed metadata from an earlier poll still holds.
+            try:
+                mtime_ns = meta_path.stat().st_mtime_ns
+            except FileNotFoundError:
                 continue
-            meta_path = worker_dir / "worker.json"
-            if not meta_path.exists():
+            cached = self._worker_cache.get(entry.path)
+            if cached is not None and cached[0] == mtime_ns:
+                workers[cached[1].tmux_session] = cached[1]
                 continue
             try:
-                data = json.loads(meta_path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
+                data = orjson.loads(meta_path.read_bytes())
+            except orjson.JSONDecodeError:
                 continue
             worker_id = str(data.get("id") or "")
             session = str(data.get("tmux_session") or "")
             if not worker_id or not session:
                 continue
-            cli_type = str(data.get("cli_type") or settings.default_cli_type)
-            workers[session] = WorkerMetadata(
+            cli_type = sys.intern(str(data.get("cli_type") or settings.default_cli_type))
+            worker = WorkerMetadata(
                 worker_id=worker_id,
                 tmux_session=session,
-                workspace=worker_dir,
+                workspace=Path(entry.path),
                 cli_type=cli_type,
             )
+            self._worker_cache[entry.path] = (mtime_ns, worker)
+            workers[session] = worker
         return workers
 
 
 def strip_ansi(text: str) -> str:
-    return ANSI_ESCAPE_RE.sub("", text)
+    if _ansi_db is None:
+        return ANSI_ESCAPE_RE.sub("", text)
+    # Hyperscan reports match intervals; emit the complement spans into one
+    # bytearray so stripping a pane snapshot is a single scan plus a copy.
+    buf = text.encode("utf-8")
+    out = bytearray()
+    last = 0
+
+    def _on_match(_id: int, from_: int, to: int, _flags: int, _ctx: object) -> None:
+        nonlocal last
+        if from_ > last:
+            out.extend(buf[last:from_])
+        if to > last:
+            last = to
+
+    _ansi_db.scan(buf, match_event_handler=_on_match)
+    out.extend(buf[last:])
+    return out.decode("utf-8", "replace")
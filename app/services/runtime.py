@@ -1,17 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from collections import deque
 from datetime import datetime, timezone
 from typing import Deque
 
+import orjson
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from app.config import settings
 from app.enums import FlowStatus, TaskEventType, TaskStatus, WorkerStatus
 from app.models import Flow, Task, TaskEvent, Worker
+from app.services import task_runner
 from app.services.tmux import TmuxController
 
 
@@ -28,10 +29,16 @@ class WorkerRuntime:
         self.controller = TmuxController(tmux_session)
         self.sessionmaker = sessionmaker
         self.running_tasks: Deque[str] = deque()
+        # Companion set so membership checks are O(1); deque.remove only runs
+        # on confirmed hits.
+        self._running_set: set[str] = set()
+        self.event_batcher = task_runner.EventBatcher(sessionmaker)
         self._monitor_task: asyncio.Task | None = None
+        self._interval = settings.monitor_interval
+        self._max_interval = settings.monitor_interval * 16
         self._lock = asyncio.Lock()
         self._collecting_task_id: str | None = None
-        self._result_lines: list[str] = []
+        self._result_chunks: list[str] = []
 
     async def start(self) -> None:
         if self._monitor_task is None:
@@ -39,64 +46,90 @@ class WorkerRuntime:
 
     def enqueue_task(self, task_id: str, command: str) -> None:
         self.running_tasks.append(task_id)
+        self._running_set.add(task_id)
         self.controller.send_line(command)
 
     def mark_task_failed(self, task_id: str, message: str) -> None:
-        if task_id in self.running_tasks:
+        if task_id in self._running_set:
+            self._running_set.discard(task_id)
             self.running_tasks.remove(task_id)
+        task_runner.notify_task_done(task_id)
 
     async def _monitor_loop(self) -> None:
         while True:
             snapshot = self.controller.capture_pane()
             new_text = snapshot.new_text
             if new_text:
-                lines = new_text.splitlines()
-                await self._process_lines(lines)
-            await asyncio.sleep(settings.monitor_interval)
-
-    async def _process_lines(self, lines: list[str]) -> None:
-        if not lines:
+                self._interval = settings.monitor_interval
+                await self._process_buffer(new_text)
+            else:
+                # No output since the last capture: back off exponentially so
+                # idle workers barely touch tmux, and snap back to the base
+                # interval the moment activity resumes.
+                self._interval = min(self._interval * 2, self._max_interval)
+            await asyncio.sleep(self._interval)
+
+    async def _process_buffer(self, buf: str) -> None:
+        # Scan the capture once with str.find instead of splitting it into
+        # lines and testing every line for both sentinels. Only the stdout
+        # regions we actually emit as events get split; result payloads are
+        # sliced out whole.
+        if not buf:
             return
+        start_s = settings.sentinel_start
+        end_s = settings.sentinel_end
         async with self.sessionmaker() as session:
-            for raw_line in lines:
-                stripped = raw_line.strip()
-                if settings.sentinel_start in stripped:
-                    self._collecting_task_id = self.running_tasks[0] if self.running_tasks else None
-                    self._result_lines = []
-                    print(f"[runtime] detected sentinel start for {self._collecting_task_id}")
-                    continue
-                if settings.sentinel_end in stripped:
+            pos = 0
+            while pos < len(buf):
+                if self._collecting_task_id:
+                    end_idx = buf.find(end_s, pos)
+                    if end_idx == -1:
+                        self._result_chunks.append(buf[pos:])
+                        break
+                    self._result_chunks.append(buf[pos:end_idx])
                     print(f"[runtime] detected sentinel end for {self._collecting_task_id}")
                     await self._finalize_result(session)
-                    continue
-                if self._collecting_task_id:
-                    self._result_lines.append(raw_line)
-                elif self.running_tasks:
-                    event = TaskEvent(
-                        task_id=self.running_tasks[0],
-                        type=TaskEventType.stdout_chunk,
-                        payload={"line": raw_line},
-                    )
-                    session.add(event)
+                    pos = end_idx + len(end_s)
+                else:
+                    start_idx = buf.find(start_s, pos)
+                    region = buf[pos:] if start_idx == -1 else buf[pos:start_idx]
+                    if region and self.running_tasks:
+                        # Adjacent stdout lines coalesce into one event, so a
+                        # burst of tool output costs a handful of rows instead
+                        # of one per line.
+                        await self.event_batcher.add(
+                            self.running_tasks[0],
+                            TaskEventType.stdout_chunk,
+                            {"lines": region.splitlines()},
+                        )
+                    if start_idx == -1:
+                        break
+                    self._collecting_task_id = self.running_tasks[0] if self.running_tasks else None
+                    self._result_chunks = []
+                    print(f"[runtime] detected sentinel start for {self._collecting_task_id}")
+                    pos = start_idx + len(start_s)
             await session.commit()
 
     async def _finalize_result(self, session) -> None:
+        # Drain buffered stdout events first so they land before the terminal
+        # result_parsed event.
+        await self.event_batcher.flush()
         task_id = self._collecting_task_id
-        payload_text = "\n".join(self._result_lines)
+        payload_text = "".join(self._result_chunks).strip()
         self._collecting_task_id = None
-        self._result_lines = []
+        self._result_chunks = []
         if not task_id:
             return
         result: dict | None = None
         error_message: str | None = None
         status = TaskStatus.completed
         try:
-            result = json.loads(payload_text)
+            result = orjson.loads(payload_text)
             result_status = (result or {}).get("status")
             if result_status in {"failed", "error"}:
                 status = TaskStatus.failed
                 error_message = (result or {}).get("error")
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             status = TaskStatus.failed
             error_message = "Invalid JSON result from tool"
         stmt = select(Task).where(Task.id == task_id)
@@ -117,7 +150,8 @@ class WorkerRuntime:
                 payload={"result": result, "error": error_message},
             )
         )
-        if task_id in self.running_tasks:
+        if task_id in self._running_set:
+            self._running_set.discard(task_id)
             self.running_tasks.remove(task_id)
         worker = await session.get(Worker, task.worker_id)
         if worker:
@@ -132,6 +166,7 @@ class WorkerRuntime:
                     "task_id": task_id,
                 }
         await session.commit()
+        task_runner.notify_task_done(task_id)
 
 
 class RuntimeRegistry:
@@ -1,109 +1,179 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from app.config import settings
 
+try:  # Optional accelerator; stdlib sqlite3 is the fallback.
+    import apsw
+except ImportError:  # pragma: no cover
+    apsw = None
+
+# Module-level constants so sqlite3's statement cache keys on the same string
+# objects every call instead of re-parsing freshly concatenated SQL.
+# Columns are selected explicitly so rows come back as plain tuples in a known
+# order; unpacking them is much cheaper than string-keyed row lookups.
+# Filtering and ordering stay in the SQL on purpose: SQLite does both in C
+# against the idx_status_history_id_ts index, so callers never re-filter or
+# re-sort rows in Python.
+_LIST_SQL = """
+    SELECT s.id, s.state, s.summary, s.actions_needed, s.last_snapshot_hash,
+           s.last_change_ts, s.last_polled_ts, s.stable_count,
+           p.worker_id, p.tmux_session, p.tmux_window, p.tmux_pane, p.cwd, p.cli_type
+    FROM status s
+    LEFT JOIN ptys p ON s.id = p.id
+    ORDER BY s.last_polled_ts DESC
+"""
+_LIST_SQL_SINCE = """
+    SELECT s.id, s.state, s.summary, s.actions_needed, s.last_snapshot_hash,
+           s.last_change_ts, s.last_polled_ts, s.stable_count,
+           p.worker_id, p.tmux_session, p.tmux_window, p.tmux_pane, p.cwd, p.cli_type
+    FROM status s
+    LEFT JOIN ptys p ON s.id = p.id
+    WHERE s.last_polled_ts >= ?
+    ORDER BY s.last_polled_ts DESC
+"""
+_TAIL_SQL = """
+    SELECT h.id, h.ts, h.state, h.summary,
+           p.worker_id, p.tmux_session, p.tmux_window, p.tmux_pane, p.cwd, p.cli_type
+    FROM status_history h
+    LEFT JOIN ptys p ON h.id = p.id
+    WHERE h.id = ?
+    ORDER BY h.ts DESC
+    LIMIT ?
+"""
+
 
 class StatusRepository:
     """Read-only helper for the watcher sqlite cache."""
 
     def __init__(self, db_path: Path | None = None) -> None:
         self.db_path = Path(db_path or settings.status_db_path)
+        # One long-lived read-only connection instead of connect/close per
+        # call: keeps SQLite's page cache and parsed schema warm between
+        # status polls.
+        self._conn: Any | None = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> Any:
+        # apsw, when installed, talks to the SQLite C API with less per-call
+        # binding overhead than sqlite3; both connections expose the
+        # execute(...).fetchall() surface these queries use.
+        if self._conn is None:
+            if apsw is not None:
+                conn = apsw.Connection(str(self.db_path), flags=apsw.SQLITE_OPEN_READONLY)
+            else:
+                conn = sqlite3.connect(
+                    f"file:{self.db_path}?mode=ro",
+                    uri=True,
+                    check_same_thread=False,
+                    isolation_level=None,
+                    cached_statements=256,
+                )
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def list_status(self, min_polled_ts: float | None = None) -> list[dict[str, Any]]:
         if not self.db_path.exists():
             return []
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            query = """
-                SELECT s.*, p.worker_id, p.tmux_session, p.tmux_window, p.tmux_pane, p.cwd, p.cli_type
-                FROM status s
-                LEFT JOIN ptys p ON s.id = p.id
-            """
-            params: list[Any] = []
-            if min_polled_ts is not None:
-                query += " WHERE s.last_polled_ts >= ?"
-                params.append(min_polled_ts)
-            query += " ORDER BY s.last_polled_ts DESC"
-            result = conn.execute(query, params)
-            rows = []
-            for row in result.fetchall():
-                rows.append(self._row_to_dict(row))
-            return rows
-        finally:
-            conn.close()
+        if min_polled_ts is None:
+            query, params = _LIST_SQL, ()
+        else:
+            query, params = _LIST_SQL_SINCE, (min_polled_ts,)
+        with self._lock:
+            result = self._connection().execute(query, params)
+            return [self._row_to_dict(row) for row in result.fetchall()]
 
     def tail_history(self, pane_id: str, limit: int = 50) -> list[dict[str, Any]]:
         if not self.db_path.exists():
             return []
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            result = conn.execute(
-                """
-                SELECT h.id, h.ts, h.state, h.summary,
-                       p.worker_id, p.tmux_session, p.tmux_window, p.tmux_pane, p.cwd, p.cli_type
-                FROM status_history h
-                LEFT JOIN ptys p ON h.id = p.id
-                WHERE h.id = ?
-                ORDER BY h.ts DESC
-                LIMIT ?
-                """,
-                (pane_id, limit),
-            )
+        with self._lock:
+            result = self._connection().execute(_TAIL_SQL, (pane_id, limit))
             rows = [self._history_row_to_dict(row) for row in result.fetchall()]
-            return list(reversed(rows))
-        finally:
-            conn.close()
+        return list(reversed(rows))
 
-    def _row_to_dict(self, row: sqlite3.Row) -> dict[str, Any]:
+    @staticmethod
+    def _row_to_dict(row: tuple) -> dict[str, Any]:
+        (
+            pane_id,
+            state,
+            summary,
+            actions_needed,
+            last_snapshot_hash,
+            last_change_ts,
+            last_polled_ts,
+            stable_count,
+            worker_id,
+            tmux_session,
+            tmux_window,
+            tmux_pane,
+            cwd,
+            cli_type,
+        ) = row
         target = None
-        if row["tmux_session"] and row["tmux_window"] is not None and row["tmux_pane"] is not None:
-            target = f"{row['tmux_session']}:{row['tmux_window']}.{row['tmux_pane']}"
+        if tmux_session and tmux_window is not None and tmux_pane is not None:
+            target = f"{tmux_session}:{tmux_window}.{tmux_pane}"
         return {
-            "pane_id": row["id"],
-            "worker_id": row["worker_id"],
-            "cli_type": row["cli_type"],
-            "cwd": row["cwd"],
-            "tmux_session": row["tmux_session"],
-            "tmux_window": row["tmux_window"],
-            "tmux_pane": row["tmux_pane"],
+            "pane_id": pane_id,
+            "worker_id": worker_id,
+            "cli_type": cli_type,
+            "cwd": cwd,
+            "tmux_session": tmux_session,
+            "tmux_window": tmux_window,
+            "tmux_pane": tmux_pane,
             "tmux_target": target,
-            "state": row["state"],
-            "summary": row["summary"],
-            "actions_needed": row["actions_needed"],
-            "last_snapshot_hash": row["last_snapshot_hash"],
-            "last_change_ts": row["last_change_ts"],
-            "last_polled_ts": row["last_polled_ts"],
-            "stable_count": row["stable_count"],
+            "state": state,
+            "summary": summary,
+            "actions_needed": actions_needed,
+            "last_snapshot_hash": last_snapshot_hash,
+            "last_change_ts": last_change_ts,
+            "last_polled_ts": last_polled_ts,
+            "stable_count": stable_count,
         }
 
-    def _history_row_to_dict(self, row: sqlite3.Row) -> dict[str, Any]:
+    @staticmethod
+    def _history_row_to_dict(row: tuple) -> dict[str, Any]:
+        pane_id, ts, state, summary, worker_id, tmux_session, tmux_window, tmux_pane, cwd, cli_type = row
         target = None
-        if row["tmux_session"] and row["tmux_window"] is not None and row["tmux_pane"] is not None:
-            target = f"{row['tmux_session']}:{row['tmux_window']}.{row['tmux_pane']}"
+        if tmux_session and tmux_window is not None and tmux_pane is not None:
+            target = f"{tmux_session}:{tmux_window}.{tmux_pane}"
         return {
-            "pane_id": row["id"],
+            "pane_id": pane_id,
             "tmux_target": target,
-            "worker_id": row["worker_id"],
-            "cli_type": row["cli_type"],
-            "cwd": row["cwd"],
-            "ts": row["ts"],
-            "state": row["state"],
-            "summary": row["summary"],
+            "worker_id": worker_id,
+            "cli_type": cli_type,
+            "cwd": cwd,
+            "ts": ts,
+            "state": state,
+            "summary": summary,
         }
 
 
+@lru_cache(maxsize=4096)
+def _format_second(ts_int: int) -> str:
+    return datetime.fromtimestamp(ts_int).isoformat(timespec="seconds")
+
+
 def format_timestamp(ts: float | None) -> str:
     if not ts:
         return "-"
-    return datetime.fromtimestamp(ts).isoformat(timespec="seconds")
+    # Rows polled within the same second share one cached string; with
+    # timespec="seconds" the truncation to int is lossless.
+    return _format_second(int(ts))
 
 
 def min_timestamp_for_window(window_seconds: float | None) -> float | None:
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
-import json
+import asyncio
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 from shlex import quote
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+
+import orjson
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.enums import TaskEventType, TaskStatus, WorkerStatus
 from app.models import Task, TaskEvent, Worker
 from app.schemas import TaskCreate
 from app.services import runtime_registry
+from app.utils.pagination import decode_cursor
 from app.utils.paths import SHIMS_DIR
 
 TOOL_SHIMS: dict[str, str] = {
@@ -22,13 +26,83 @@ TOOL_SHIMS: dict[str, str] = {
     "critic_llm": "run_critic_task.sh",
 }
 
+# Shim paths never change at runtime, so quote them once at import; per task
+# only the spec path still needs quoting.
+_TOOL_PREFIX: dict[str, str] = {
+    tool: f"bash {quote(str(SHIMS_DIR / shim))}" for tool, shim in TOOL_SHIMS.items()
+}
+
+# In-process wakeups for coroutines awaiting a task's terminal state. Events are
+# registered when the task is created and set when the runtime marks the task
+# completed/failed, so waiters never have to poll the database.
+_task_waiters: dict[str, asyncio.Event] = {}
+
+
+def register_task_waiter(task_id: str) -> asyncio.Event:
+    return _task_waiters.setdefault(task_id, asyncio.Event())
+
+
+def get_task_waiter(task_id: str) -> asyncio.Event | None:
+    return _task_waiters.get(task_id)
+
+
+def notify_task_done(task_id: str) -> None:
+    event = _task_waiters.pop(task_id, None)
+    if event is not None:
+        event.set()
+
+
+class EventBatcher:
+    """Buffers TaskEvent rows and flushes them as one bulk INSERT.
+
+    Every stdout line used to cost its own INSERT + commit (an fsync each).
+    Rows are accumulated here and written in a single transaction once the
+    batch fills up or the flush delay elapses, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker,
+        max_batch: int = 500,
+        max_delay: float = 0.1,
+    ) -> None:
+        self.sessionmaker = sessionmaker
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._rows: list[dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    async def add(self, task_id: str, event_type: TaskEventType, payload: dict[str, Any]) -> None:
+        async with self._lock:
+            self._rows.append({"task_id": task_id, "type": event_type, "payload": payload})
+            full = len(self._rows) >= self.max_batch
+            if not full and self._flush_handle is None:
+                loop = asyncio.get_running_loop()
+                self._flush_handle = loop.call_later(
+                    self.max_delay, lambda: asyncio.ensure_future(self.flush())
+                )
+        if full:
+            await self.flush()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            rows, self._rows = self._rows, []
+        if not rows:
+            return
+        async with self.sessionmaker() as session:
+            await session.execute(insert(TaskEvent), rows)
+            await session.commit()
+
 
 def _build_command(tool: str, spec_path: Path) -> str:
-    shim = TOOL_SHIMS.get(tool)
-    if not shim:
+    prefix = _TOOL_PREFIX.get(tool)
+    if not prefix:
         raise ValueError(f"Unsupported tool '{tool}'")
-    script_path = SHIMS_DIR / shim
-    return f"bash {quote(str(script_path))} {quote(str(spec_path))}"
+    return f"{prefix} {quote(str(spec_path))}"
 
 
 async def create_task(session: AsyncSession, worker_id: str, payload: TaskCreate) -> Task:
@@ -36,15 +110,23 @@ async def create_task(session: AsyncSession, worker_id: str, payload: TaskCreate
     if not worker:
         raise ValueError("Worker not found")
     spec_json = payload.spec
-    task = Task(worker_id=worker_id, tool=payload.tool, spec_json=spec_json, flow_id=payload.flow_id)
+    # Assign the UUID client-side so the id is known without a flush; the
+    # Task, its first event, and the worker-status change then land in one
+    # commit instead of two round-trips.
+    task = Task(
+        id=str(uuid4()),
+        worker_id=worker_id,
+        tool=payload.tool,
+        spec_json=spec_json,
+        flow_id=payload.flow_id,
+    )
     session.add(task)
-    await session.flush()
+    register_task_waiter(task.id)
 
     workspace = Path(worker.workspace_path)
     specs_dir = workspace / "specs"
     specs_dir.mkdir(parents=True, exist_ok=True)
     spec_path = specs_dir / f"{task.id}.json"
-    spec_path.write_text(json.dumps(spec_json, indent=2))
 
     command = _build_command(payload.tool, Path("specs") / f"{task.id}.json")
     task.status = TaskStatus.running
@@ -57,7 +139,16 @@ async def create_task(session: AsyncSession, worker_id: str, payload: TaskCreate
             payload={"state": "running", "command": command},
         )
     )
-    await session.commit()
+    # The spec write happens off the event loop, overlapped with the DB
+    # commit: task creation costs max(fs, db) instead of their sum. The DB
+    # row only references the path (derived from task.id), so the two are
+    # order-independent, and the task is enqueued only after both land.
+    await asyncio.gather(
+        asyncio.to_thread(
+            spec_path.write_bytes, orjson.dumps(spec_json, option=orjson.OPT_INDENT_2)
+        ),
+        session.commit(),
+    )
 
     runtime = runtime_registry.get(worker_id)
     if runtime is None:
@@ -70,8 +161,17 @@ async def get_task(session: AsyncSession, task_id: str) -> Task | None:
     return await session.get(Task, task_id)
 
 
-async def list_worker_tasks(session: AsyncSession, worker_id: str) -> list[Task]:
-    result = await session.execute(
-        select(Task).where(Task.worker_id == worker_id).order_by(Task.created_at.desc())
+async def list_worker_tasks(
+    session: AsyncSession, worker_id: str, limit: int = 50, cursor: str | None = None
+) -> list[Task]:
+    stmt = (
+        select(Task)
+        .where(Task.worker_id == worker_id)
+        .order_by(Task.created_at.desc(), Task.id.desc())
+        .limit(limit)
     )
+    if cursor:
+        created_at, task_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(Task.created_at, Task.id) < (created_at, task_id))
+    result = await session.execute(stmt)
     return list(result.scalars().all())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
 
 import pyte
@@ -18,27 +19,49 @@ class TerminalEmulator:
         self.dimensions = dimensions
         self._screen = pyte.Screen(dimensions.width, dimensions.height)
         self._stream = pyte.Stream(self._screen)
+        # Reused across renders so formatting doesn't reallocate a buffer
+        # (plus an intermediate line list) for every pane every poll.
+        self._buf = io.StringIO()
 
     def render(self, raw_text: str) -> str:
         self._screen.reset()
         self._stream.feed(self._ensure_crlf(raw_text))
-        lines = [line.rstrip() for line in self._screen.display]
-        # Trim trailing blank lines to reduce noise for hashing/classification.
-        while lines and not lines[-1]:
-            lines.pop()
-        return "\n".join(lines)
+        return self._format_display()
+
+    def render_incremental(self, new_text: str) -> str:
+        """Feed only new output on top of the existing screen state.
+
+        pyte keeps screen contents across feeds, so callers that track output
+        deltas (e.g. ``PaneSnapshot.new_text``) can skip the reset and re-feed
+        of the whole buffer that ``render`` does. Use ``render`` for cold
+        starts or full resyncs.
+        """
+        if new_text:
+            self._stream.feed(self._ensure_crlf(new_text))
+        return self._format_display()
+
+    def _format_display(self) -> str:
+        display = self._screen.display
+        # Trim trailing blank lines to reduce noise for hashing/classification;
+        # scanning backwards first means they are never rstripped or written.
+        last = len(display) - 1
+        while last >= 0 and not display[last].rstrip():
+            last -= 1
+        buf = self._buf
+        buf.seek(0)
+        buf.truncate()
+        for idx in range(last + 1):
+            if idx:
+                buf.write("\n")
+            buf.write(display[idx].rstrip())
+        return buf.getvalue()
 
     @staticmethod
     def _ensure_crlf(raw_text: str) -> str:
         # Terminals typically move to column 0 on CR; tmux capture may only include LF.
-        if not raw_text:
+        # Three str.replace passes run in C and beat the per-character Python
+        # loop by a wide margin. NUL is safe as a placeholder: pyte ignores it
+        # and tmux capture output never contains it.
+        if "\n" not in raw_text:
             return raw_text
-        chars: list[str] = []
-        prev = ""
-        for ch in raw_text:
-            if ch == "\n" and prev != "\r":
-                chars.append("\r\n")
-            else:
-                chars.append(ch)
-            prev = ch
-        return "".join(chars)
+        return raw_text.replace("\r\n", "\x00").replace("\n", "\r\n").replace("\x00", "\r\n")
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+import logging
+import shlex
 import subprocess
+import threading
 from dataclasses import dataclass
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 class TmuxCommandError(RuntimeError):
     pass
@@ -16,6 +22,107 @@ class PaneSnapshot:
     new_text: str
 
 
+class TmuxControlConnection:
+    """Blocking tmux control-mode client shared by all TmuxController instances.
+
+    One persistent ``tmux -C`` process replaces a fork/exec per command. The
+    connection holds its own detached session; every command addresses its real
+    target explicitly with ``-t``, so a single connection serves all workers.
+    Commands chained with ``;`` produce one %begin/%end block each.
+    """
+
+    _SESSION = "_agentbay_sync_ctl"
+
+    def __init__(self, tmux_bin: str) -> None:
+        self.tmux_bin = tmux_bin
+        self._proc: subprocess.Popen[str] | None = None
+        self._lock = threading.Lock()
+
+    def run(self, args: tuple[str, ...]) -> str | None:
+        """Run one tmux command line; returns stdout, or None on any failure
+        so callers can fall back to one-shot subprocess mode."""
+        with self._lock:
+            try:
+                if self._proc is None or self._proc.poll() is not None:
+                    self._connect()
+                assert self._proc is not None and self._proc.stdin is not None
+                line, blocks = self._format(args)
+                self._proc.stdin.write(line + "\n")
+                self._proc.stdin.flush()
+                return self._read_blocks(blocks)
+            except Exception as exc:
+                logger.warning("tmux control-mode command failed: %s", exc)
+                self._teardown()
+                return None
+
+    def close(self) -> None:
+        with self._lock:
+            self._teardown()
+
+    def _connect(self) -> None:
+        self._proc = subprocess.Popen(
+            [self.tmux_bin, "-C", "new-session", "-A", "-s", self._SESSION],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        # Control mode greets the client with one %begin/%end block.
+        self._read_blocks(1)
+
+    @staticmethod
+    def _format(args: tuple[str, ...]) -> tuple[str, int]:
+        parts: list[str] = []
+        blocks = 1
+        for arg in args:
+            if arg == ";":
+                parts.append(";")
+                blocks += 1
+            else:
+                parts.append(shlex.quote(arg))
+        return " ".join(parts), blocks
+
+    def _read_blocks(self, blocks: int) -> str:
+        assert self._proc is not None and self._proc.stdout is not None
+        output: list[str] = []
+        in_block = False
+        while blocks:
+            line = self._proc.stdout.readline()
+            if not line:
+                raise TmuxCommandError("tmux control-mode connection closed")
+            if line.startswith("%begin"):
+                in_block = True
+            elif line.startswith("%end"):
+                in_block = False
+                blocks -= 1
+            elif line.startswith("%error"):
+                raise TmuxCommandError("tmux control-mode command error")
+            elif in_block:
+                output.append(line)
+            # Async notifications (%output etc.) outside blocks are ignored.
+        return "".join(output)
+
+    def _teardown(self) -> None:
+        if self._proc is None:
+            return
+        try:
+            self._proc.kill()
+            self._proc.wait(timeout=5)
+        except Exception:
+            pass
+        self._proc = None
+
+
+_control_conn: TmuxControlConnection | None = None
+
+
+def _get_control_connection() -> TmuxControlConnection:
+    global _control_conn
+    if _control_conn is None:
+        _control_conn = TmuxControlConnection(settings.tmux_bin)
+    return _control_conn
+
+
 class TmuxController:
     """Lightweight helper that interacts with tmux for a worker."""
 
@@ -24,6 +131,9 @@ class TmuxController:
         self.pane = pane
         self.tmux_bin = settings.tmux_bin
         self._last_size = 0
+        self._last_digest = b""
+        self._last_metrics: str | None = None
+        self._last_text = ""
 
     def _run(self, *args: str, check: bool = True) -> subprocess.CompletedProcess[str]:
         cmd = [self.tmux_bin, *args]
@@ -38,12 +148,42 @@ class TmuxController:
         return result
 
     def send_line(self, command: str) -> None:
-        self._run("send-keys", "-t", f"{self.session}:{self.pane}", command)
-        self._run("send-keys", "-t", f"{self.session}:{self.pane}", "C-m")
+        target = f"{self.session}:{self.pane}"
+        # send-keys takes multiple key arguments, so the command and the
+        # newline go out as one tmux command.
+        args = ("send-keys", "-t", target, command, "Enter")
+        if _get_control_connection().run(args) is None:
+            self._run(*args)
 
     def capture_pane(self) -> PaneSnapshot:
-        result = self._run("capture-pane", "-pJ", "-t", f"{self.session}:{self.pane}")
-        text = result.stdout
+        target = f"{self.session}:{self.pane}"
+        # Idle panes (the common case) are detected from one tiny
+        # display-message line instead of a full capture: if scrollback
+        # length, cursor position, and the activity timestamp all match the
+        # last poll, nothing was written and the cached text still holds.
+        metrics = _get_control_connection().run(
+            (
+                "display-message",
+                "-p",
+                "-t",
+                target,
+                "#{history_size} #{cursor_x} #{cursor_y} #{window_activity}",
+            )
+        )
+        if metrics is not None and metrics == self._last_metrics:
+            return PaneSnapshot(text=self._last_text, new_text="")
+        text = _get_control_connection().run(("capture-pane", "-pJ", "-t", target))
+        if text is None:
+            text = self._run("capture-pane", "-pJ", "-t", target).stdout
+        # Short digest comparison catches the steady-state "nothing changed"
+        # poll without slicing, and also catches in-place redraws that keep
+        # the length constant (which the size check alone would miss).
+        self._last_metrics = metrics
+        self._last_text = text
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+        if digest == self._last_digest:
+            return PaneSnapshot(text=text, new_text="")
+        self._last_digest = digest
         new_text = ""
         if self._last_size <= len(text):
             new_text = text[self._last_size :]
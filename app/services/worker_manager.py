@@ -1,19 +1,20 @@
 from __future__ import annotations
 
-import json
 import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import select
+import orjson
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.enums import WorkerStatus
 from app.models import Worker
 from app.services import runtime_registry
+from app.utils.pagination import decode_cursor
 
 
 class WorkerManager:
@@ -22,8 +23,14 @@ class WorkerManager:
         self.workspace_root.mkdir(parents=True, exist_ok=True)
         self._next_ttyd_port = settings.ttyd_port_start
 
-    async def list_workers(self, session: AsyncSession) -> list[Worker]:
-        result = await session.execute(select(Worker))
+    async def list_workers(
+        self, session: AsyncSession, limit: int = 50, cursor: str | None = None
+    ) -> list[Worker]:
+        stmt = select(Worker).order_by(Worker.created_at.desc(), Worker.id.desc()).limit(limit)
+        if cursor:
+            created_at, worker_id = decode_cursor(cursor)
+            stmt = stmt.where(tuple_(Worker.created_at, Worker.id) < (created_at, worker_id))
+        result = await session.execute(stmt)
         return list(result.scalars().all())
 
     async def get_worker(self, session: AsyncSession, worker_id: str) -> Worker | None:
@@ -41,8 +48,8 @@ class WorkerManager:
         ttyd_url, ttyd_pid = self._start_ttyd(tmux_session)
         created_at = datetime.now(timezone.utc).isoformat()
         metadata_path = workspace / "worker.json"
-        metadata_path.write_text(
-            json.dumps(
+        metadata_path.write_bytes(
+            orjson.dumps(
                 {
                     "id": worker_id,
                     "label": label,
@@ -51,9 +58,8 @@ class WorkerManager:
                     "cli_type": settings.default_cli_type,
                     "created_at": created_at,
                 },
-                indent=2,
-            ),
-            encoding="utf-8",
+                option=orjson.OPT_INDENT_2,
+            )
         )
         worker = Worker(
             id=worker_id,
@@ -70,9 +76,16 @@ class WorkerManager:
         return worker
 
     def _start_tmux_session(self, session_name: str, workspace: Path) -> None:
+        # close_fds=False lets CPython (pre-3.13) take the posix_spawn fast
+        # path instead of fork+exec, which matters once the conductor's page
+        # tables grow. Safe here: the tmux client exits as soon as the
+        # detached session exists, so inherited descriptors are released
+        # immediately. The workspace is set via -c rather than cwd= because a
+        # cwd override would also force the fork path.
         subprocess.run(
             [settings.tmux_bin, "new-session", "-d", "-s", session_name, "-c", str(workspace)],
             check=True,
+            close_fds=False,
         )
 
     def _start_ttyd(self, tmux_session: str) -> tuple[str | None, Optional[int]]:
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    return f"{created_at.isoformat()}:{row_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    # The id is a UUID and never contains a colon, so split from the right to
+    # keep the ISO timestamp (which does) intact.
+    timestamp, _, row_id = cursor.rpartition(":")
+    return datetime.fromisoformat(timestamp), row_id
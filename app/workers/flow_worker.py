@@ -0,0 +1,39 @@
+"""Durable execution of flow coordinators outside the web process.
+
+When ``CONDUCTOR_FLOW_BROKER_URL`` is set, the API process only enqueues flow
+ids; a separate ``dramatiq app.workers.flow_worker`` process runs the
+coordinator, so long refinement loops neither compete with request handlers
+nor die with a uvicorn restart. Without a broker the coordinator keeps its
+in-process ``asyncio.create_task`` kickoff (the default for dev and tests).
+"""
+from __future__ import annotations
+
+import asyncio
+
+from app.config import settings
+
+_run_flow_actor = None
+
+
+def _ensure_actor():
+    global _run_flow_actor
+    if _run_flow_actor is None:
+        import dramatiq  # lazy import; only needed when a broker is configured
+        from dramatiq.brokers.redis import RedisBroker
+
+        dramatiq.set_broker(RedisBroker(url=settings.flow_broker_url))
+
+        @dramatiq.actor(max_retries=3)
+        def run_flow(flow_id: str) -> None:
+            from app.db import AsyncSessionLocal
+            from app.flows.design_refinement import DesignRefinementCoordinator
+
+            coordinator = DesignRefinementCoordinator(AsyncSessionLocal)
+            asyncio.run(coordinator._run(flow_id))
+
+        _run_flow_actor = run_flow
+    return _run_flow_actor
+
+
+def enqueue_flow(flow_id: str) -> None:
+    _ensure_actor().send(flow_id)
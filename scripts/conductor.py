@@ -12,7 +12,6 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from app.services.pty_watcher import PtyWatcher  # noqa: E402
 from app.services.status_repo import (  # noqa: E402
     StatusRepository,
     format_timestamp,
@@ -26,6 +25,11 @@ def _configure_logging(verbose: bool) -> None:
 
 
 async def _run_pty_watch(interval: float | None) -> None:
+    # Imported here so `pty status`/`pty tail` (cheap enough for a tmux
+    # status line polled every second) don't pay for the watcher's full
+    # sqlalchemy/pyte import chain.
+    from app.services.pty_watcher import PtyWatcher
+
     watcher = PtyWatcher(interval=interval)
     await watcher.run()
 
@@ -90,25 +94,25 @@ def _run_pty_tail(args: argparse.Namespace) -> None:
 
 
 def _print_table(headers: list[str], rows: Iterable[Iterable[str]]) -> None:
-    rows = list(rows)
-    widths = [len(header) for header in headers]
-    for row in rows:
-        for idx, value in enumerate(row):
-            widths[idx] = max(widths[idx], len(value))
+    rows = [list(row) for row in rows]
+    widths = [
+        max(len(header), *(len(row[idx]) for row in rows)) if rows else len(header)
+        for idx, header in enumerate(headers)
+    ]
     fmt = "  ".join(f"{{:{w}}}" for w in widths)
-    print(fmt.format(*headers))
-    print("  ".join("-" * w for w in widths))
-    for row in rows:
-        print(fmt.format(*row))
+    # One buffered write instead of a print (and syscall) per row.
+    lines = [fmt.format(*headers), "  ".join("-" * w for w in widths)]
+    lines.extend(fmt.format(*row) for row in rows)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(prog="conductor", description="Conductor helper CLI")
     parser.add_argument("--verbose", action="store_true", help="Enable debug logging")
-    subparsers = parser.add_subparsers(dest="command")
+    subparsers = parser.add_subparsers(dest="command", required=True)
 
     pty_parser = subparsers.add_parser("pty", help="PTY helper commands")
-    pty_subparsers = pty_parser.add_subparsers(dest="pty_command")
+    pty_subparsers = pty_parser.add_subparsers(dest="pty_command", required=True)
 
     watch_parser = pty_subparsers.add_parser("watch", help="Run the tmux watcher daemon")
     watch_parser.add_argument(
@@ -147,9 +151,6 @@ def main(argv: list[str] | None = None) -> int:
     tail_parser.set_defaults(func=_run_pty_tail)
 
     args = parser.parse_args(argv)
-    if not hasattr(args, "func"):
-        parser.print_help()
-        return 1
     _configure_logging(args.verbose)
     try:
         args.func(args)
@@ -4,9 +4,13 @@ from __future__ import annotations
 import json
 import time
 from pathlib import Path
-from urllib import request
+
+import requests
 
 BASE_URL = "http://127.0.0.1:8100"
+# Keep-alive session: the polling loops below issue 100+ requests, and
+# reusing one connection avoids a TCP handshake per poll.
+SESSION = requests.Session()
 LOG_PATH = Path(__file__).with_suffix(".log")
 TIMEOUTS = {
     "task_poll": 40,
@@ -23,18 +27,9 @@ def log(message: str) -> None:
 
 
 def _http(method: str, path: str, payload: dict | None = None) -> dict:
-    data = None
-    if payload is not None:
-        data = json.dumps(payload).encode()
-    req = request.Request(
-        f"{BASE_URL}{path}",
-        data=data,
-        method=method,
-        headers={"Content-Type": "application/json"},
-    )
-    with request.urlopen(req) as resp:  # type: ignore[arg-type]
-        body = resp.read().decode()
-        return json.loads(body)
+    resp = SESSION.request(method, f"{BASE_URL}{path}", json=payload)
+    resp.raise_for_status()
+    return resp.json()
 
 
 def main() -> None:
@@ -140,6 +140,8 @@ def wait_for_ready(step: str, require_activity: bool = True) -> Dict[str, Any]:
     prev = None
     saw_activity = False
     stable = 0
+    stripped = ""
+    has_prompt = False
     while time.time() - start < TIMEOUT:
         raw = capture_pane()
         changed = prev is None or raw != prev
@@ -149,11 +151,15 @@ def wait_for_ready(step: str, require_activity: bool = True) -> Dict[str, Any]:
         elif not changed and saw_activity:
             stable += 1
         prev = raw
-        stripped = strip_ansi(raw)
+        if changed:
+            # Strip + prompt scan only when the capture actually changed;
+            # unchanged ticks reuse the previous result.
+            stripped = strip_ansi(raw)
+            has_prompt = prompt_regex.search(stripped) is not None
         print(
             f"[monitor] capture={'change' if changed else 'same'} saw_activity={saw_activity} stable={stable}"
         )
-        if (saw_activity or not require_activity) and stable >= STABLE_THRESHOLD and prompt_regex.search(stripped):
+        if (saw_activity or not require_activity) and stable >= STABLE_THRESHOLD and has_prompt:
             classification = classify_screen(stripped)
             print(f"[classifier] {classification}")
             state = classification.get("state", "").upper()
@@ -177,16 +183,17 @@ def wait_for_prompt(label: str = "initial prompt") -> None:
     start = time.time()
     prev = None
     stable = 0
+    has_prompt = False
     while time.time() - start < TIMEOUT:
         raw = capture_pane()
         changed = prev is None or raw != prev
         prev = raw
-        stripped = strip_ansi(raw)
         if changed:
+            has_prompt = prompt_regex.search(strip_ansi(raw)) is not None
             stable = 0
         else:
             stable += 1
-        if prompt_regex.search(stripped) and stable >= STABLE_THRESHOLD:
+        if has_prompt and stable >= STABLE_THRESHOLD:
             print("[monitor] Prompt detected.")
             return
         time.sleep(POLL_INTERVAL)
@@ -2,39 +2,56 @@
 from __future__ import annotations
 
 import json
-import subprocess
+import mmap
+import os
+import re
 import sys
 from pathlib import Path
 from typing import Any
 
+try:  # The shim runs in worker workspaces that may lack the app venv.
+    import orjson
+except ImportError:
+    orjson = None
+
 SENTINEL_START = "<<<AGENT_RESULT_START>>>"
 SENTINEL_END = "<<<AGENT_RESULT_END>>>"
+# Byte twins for the codex pipe, which is scanned without decoding.
+SENTINEL_START_B = SENTINEL_START.encode("ascii")
+SENTINEL_END_B = SENTINEL_END.encode("ascii")
 
+# The shim never chdirs, so one getcwd at import covers every dispatch.
+_WORKSPACE = Path.cwd()
 
-def main() -> None:
-    if len(sys.argv) < 3:
-        print("Usage: tool_runner.py <tool_name> <spec_path>", file=sys.stderr)
-        sys.exit(1)
-    tool = sys.argv[1]
-    spec_path = Path(sys.argv[2])
-    spec = json.loads(spec_path.read_text())
-    if tool == "codex":
-        run_codex_cli(spec)
-        return
-    if tool in {"claude", "gemini"}:
-        result = run_coder_tool(tool, spec)
-    elif tool == "critic_llm":
-        result = run_critic_tool(spec)
-    else:
-        raise SystemExit(f"Unknown tool {tool}")
-    print(SENTINEL_START)
-    print(json.dumps(result))
-    print(SENTINEL_END)
+# Above this size the critic scans the design through mmap so the kernel
+# pages it in lazily instead of copying the whole file into a Python bytes.
+_MMAP_THRESHOLD = 256 * 1024
+_WORD_RE = re.compile(rb"\S+")
+_HEADING_RE = re.compile(rb"#")
 
+# Critic keyword rules: (lowercase needle, issue raised when it's absent).
+# All needles share one lowered copy of the document per call; add new rules
+# here rather than as ad-hoc scans in run_critic_tool.
+_CRITIC_KEYWORDS: list[tuple[bytes, str]] = [
+    (b"testing", "Add a section about testing and validation."),
+]
+_CRITIC_KEYWORD_RES = [
+    (re.compile(re.escape(keyword), re.IGNORECASE), message)
+    for keyword, message in _CRITIC_KEYWORDS
+]
 
-def run_codex_cli(spec: dict[str, Any]) -> None:
-    spec_json = json.dumps(spec, indent=2)
-    prompt = f"""
+
+def _loads(data: str | bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode() if orjson is not None else json.dumps(obj)
+
+
+# Built (and stripped) once at import; per call only the spec JSON is
+# substituted.
+_CODEX_PROMPT_TEMPLATE = """
 You are running inside the PTY-based conductor as the Codex CLI worker.
 Specification (JSON):
 {spec_json}
@@ -54,6 +71,66 @@ Instructions:
 - Emit `<JSON_SUMMARY>` as a single line with no literal newline characters.
 """.strip()
 
+# Static halves of the template, split around the spec slot and pre-encoded,
+# so the prompt streams to codex stdin without materializing the combined
+# string or re-encoding the fixed parts per call.
+_CODEX_PROMPT_PREFIX, _CODEX_PROMPT_SUFFIX = (
+    half.encode("utf-8") for half in _CODEX_PROMPT_TEMPLATE.split("{spec_json}")
+)
+
+
+def _dumps_indented(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def main() -> None:
+    if len(sys.argv) < 3:
+        print(
+            "Usage: tool_runner.py <tool_name> <spec_path> | --batch <specs.jsonl>",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    if sys.argv[1] == "--batch":
+        run_batch(Path(sys.argv[2]))
+        return
+    tool = sys.argv[1]
+    spec_path = Path(sys.argv[2])
+    _dispatch(tool, _loads(spec_path.read_bytes()))
+
+
+def run_batch(batch_path: Path) -> None:
+    # One process start amortized over many dispatches: each JSONL line is
+    # {"tool": ..., "spec": {...}} and emits its own sentinel-framed result,
+    # exactly as N single invocations would.
+    with batch_path.open("rb") as handle:
+        for line in handle:
+            if line.strip():
+                entry = _loads(line)
+                _dispatch(entry["tool"], entry["spec"])
+
+
+def _dispatch(tool: str, spec: dict[str, Any]) -> None:
+    if tool == "codex":
+        run_codex_cli(spec)
+        return
+    if tool in {"claude", "gemini"}:
+        result = run_coder_tool(tool, spec)
+    elif tool == "critic_llm":
+        result = run_critic_tool(spec)
+    else:
+        raise SystemExit(f"Unknown tool {tool}")
+    print(SENTINEL_START)
+    print(_dumps(result))
+    print(SENTINEL_END)
+
+
+def run_codex_cli(spec: dict[str, Any]) -> None:
+    # subprocess pulls in selectors/_posixsubprocess; only the codex path
+    # needs it, so the claude/gemini/critic dispatches skip the import.
+    import subprocess
+
     cmd = [
         "codex",
         "exec",
@@ -63,44 +140,85 @@ Instructions:
         "--full-auto",
         "-",
     ]
-    result = subprocess.run(cmd, input=prompt, capture_output=True, text=True, check=True)
-    stdout = result.stdout
-    stderr = result.stderr
-    start = stdout.find(SENTINEL_START)
-    end = stdout.find(SENTINEL_END)
-    if start == -1 or end == -1 or end <= start:
-        print(stdout, end="")
-        if stderr:
-            print(stderr, file=sys.stderr)
+    # Stream codex stdout instead of buffering the whole run in memory:
+    # log lines outside the sentinel block are forwarded as they arrive, and
+    # only the payload lines are held. The pipe stays binary — sentinel
+    # scanning and log forwarding never decode the stream; only the JSON
+    # payload is parsed. stderr is inherited so it also flows live (and
+    # reading it can't deadlock against the stdout loop).
+    sys.stdout.flush()  # order text-layer output ahead of raw buffer writes
+    out = sys.stdout.buffer
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=None,
+        # 16 KiB buffer: codex can emit megabytes of log lines, and draining
+        # them in page-sized chunks beats one read(2) per line.
+        bufsize=16384,
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+    # Prompt goes out in three pieces — static prefix, spec JSON, static
+    # suffix — so the combined string never exists in memory.
+    proc.stdin.write(_CODEX_PROMPT_PREFIX)
+    proc.stdin.write(_dumps_indented(spec))
+    proc.stdin.write(_CODEX_PROMPT_SUFFIX)
+    proc.stdin.close()
+    payload_lines: list[bytes] = []
+    state = "BEFORE"  # BEFORE -> INSIDE -> AFTER as sentinels are seen
+    for line in proc.stdout:
+        # One partition scan per line finds the marker and splits around it,
+        # so content sharing a line with a sentinel is kept on the right side
+        # instead of dropped with the marker.
+        if state == "BEFORE":
+            before_part, sep, tail = line.partition(SENTINEL_START_B)
+            if not sep:
+                out.write(line)
+                continue
+            state = "INSIDE"
+            if before_part.strip():
+                out.write(before_part.rstrip() + b"\n")
+            if tail.strip():
+                payload_lines.append(tail)
+        elif state == "INSIDE":
+            inner, sep, after_part = line.partition(SENTINEL_END_B)
+            if not sep:
+                payload_lines.append(line)
+                continue
+            state = "AFTER"
+            if inner.strip():
+                payload_lines.append(inner)
+            if after_part.strip():
+                out.write(after_part.lstrip())
+        else:
+            out.write(line)
+    returncode = proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+    if state != "AFTER":
         raise SystemExit("Codex output missing sentinels")
-    payload = stdout[start + len(SENTINEL_START) : end].strip()
-    compact_payload = " ".join(payload.split())
-    parsed = json.loads(compact_payload)
-    before = stdout[:start]
-    after = stdout[end + len(SENTINEL_END) :]
-    sys.stdout.write(before)
-    sys.stdout.write(after)
-    sys.stdout.write("\n" + SENTINEL_START + "\n")
-    sys.stdout.write(json.dumps(parsed) + "\n")
-    sys.stdout.write(SENTINEL_END + "\n")
-    sys.stdout.flush()
-    if stderr:
-        sys.stderr.write(stderr)
+    # json.loads tolerates interior whitespace and json.dumps re-emits a
+    # single line, so no whitespace normalization pass is needed.
+    payload = b"".join(payload_lines).strip()
+    parsed = _loads(payload)
+    # One write for the whole frame so pipe readers never see a partial
+    # sentinel block.
+    out.write(f"\n{SENTINEL_START}\n{_dumps(parsed)}\n{SENTINEL_END}\n".encode("utf-8"))
+    out.flush()
 
 
 def run_coder_tool(tool: str, spec: dict[str, Any]) -> dict[str, Any]:
-    workspace = Path.cwd()
-    design_path = workspace / "design.md"
-    design_path.parent.mkdir(parents=True, exist_ok=True)
+    design_path = _WORKSPACE / "design.md"
     if not design_path.exists():
         design_path.write_text("# Design Draft\n\n")
-    content = design_path.read_text()
     iteration = spec.get("context", {}).get("iteration", "?")
     section = spec.get("description", "Updated design section")
     instructions = spec.get("instructions", "")
     new_section = f"\n\n## Iteration {iteration} ({tool})\n\n{instructions}\n"
-    content += new_section
-    design_path.write_text(content)
+    # Append-only: each iteration writes just its section instead of
+    # re-reading and rewriting the whole (growing) document.
+    with design_path.open("a", encoding="utf-8") as handle:
+        handle.write(new_section)
     return {
         "status": "ok",
         "summary": f"Updated design via {tool} with iteration {iteration}",
@@ -109,17 +227,42 @@ def run_coder_tool(tool: str, spec: dict[str, Any]) -> dict[str, Any]:
 
 
 def run_critic_tool(spec: dict[str, Any]) -> dict[str, Any]:
-    workspace = Path.cwd()
-    design_path = workspace / spec.get("design_file", "design.md")
-    text = design_path.read_text() if design_path.exists() else ""
-    words = len(text.split())
-    heading_count = text.count("#")
+    design_path = _WORKSPACE / spec.get("design_file", "design.md")
+    # Scan raw bytes: skips the UTF-8 decode of the whole document, and the
+    # split/count/lower passes all run in C on the undecoded buffer. EAFP
+    # instead of exists() saves a stat and the check-then-read race.
+    try:
+        handle = design_path.open("rb")
+    except FileNotFoundError:
+        words = heading_count = 0
+        missing = [message for _, message in _CRITIC_KEYWORDS]
+    else:
+        with handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size > _MMAP_THRESHOLD:
+                # re patterns run directly over the mapping via the buffer
+                # protocol; no bytes copy of the file is ever made.
+                with mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+                    words = sum(1 for _ in _WORD_RE.finditer(mapped))
+                    heading_count = sum(1 for _ in _HEADING_RE.finditer(mapped))
+                    missing = [
+                        message
+                        for pattern, message in _CRITIC_KEYWORD_RES
+                        if pattern.search(mapped) is None
+                    ]
+            else:
+                text = handle.read()
+                words = len(text.split())
+                heading_count = text.count(b"#")
+                lowered = text.lower()
+                missing = [
+                    message for keyword, message in _CRITIC_KEYWORDS if keyword not in lowered
+                ]
     score = min(10, 5 + (words // 150) + heading_count)
     issues = []
     if words < 200:
         issues.append("Design is too short; expand each section with more depth.")
-    if "testing" not in text.lower():
-        issues.append("Add a section about testing and validation.")
+    issues.extend(missing)
     return {
         "status": "ok",
         "score": score,
@@ -1,16 +1,23 @@
+import pytest
+
 from app.services.terminal_emulator import TerminalDimensions, TerminalEmulator
 
 
-def test_terminal_emulator_strips_ansi_and_renders_lines() -> None:
+@pytest.fixture(scope="module")
+def emulator() -> TerminalEmulator:
+    # Shared across the module: render() resets the screen, so tests don't
+    # leak state into each other.
+    return TerminalEmulator(TerminalDimensions(width=80, height=5))
+
+
+def test_terminal_emulator_strips_ansi_and_renders_lines(emulator: TerminalEmulator) -> None:
     raw = "\x1b[31mHello\x1b[0m, \x1b[32mWorld\x1b[0m!\nSecond line\n"
-    emulator = TerminalEmulator(TerminalDimensions(width=80, height=5))
     rendered = emulator.render(raw)
-    assert rendered.splitlines() == ["Hello, World!", "Second line"]
+    assert rendered == "Hello, World!\nSecond line"
 
 
-def test_terminal_emulator_handles_cursor_movements() -> None:
+def test_terminal_emulator_handles_cursor_movements(emulator: TerminalEmulator) -> None:
     raw = "Loading-\rLoading\\"
-    emulator = TerminalEmulator(TerminalDimensions(width=80, height=3))
     rendered = emulator.render(raw)
     # Carriage return rewrites the same line; final spinner glyph should be backslash.
     assert rendered == "Loading\\"